@@ -7,11 +7,14 @@ except:
     __version__ = "0.2.0"
 
 
-from .common import Ambiente
+from .common import Ambiente, BBAPIError, BBAuthError, BBRateLimitError
 from .accountability import AccountabilityV3RepasseAPI, AccountabilityV3ControleAPI
 
 __all__ = [
     "Ambiente",
+    "BBAPIError",
+    "BBAuthError",
+    "BBRateLimitError",
     "AccountabilityV3RepasseAPI",
     "AccountabilityV3ControleAPI",
 ]
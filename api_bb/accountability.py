@@ -1,13 +1,575 @@
 import os
 import base64
 import requests
-import datetime
+import time
+import threading
 import pandas as pd
-from typing import Tuple
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from api_bb import common
 
 
+_programa_governo_insertables = (
+    "governmentProgramCode",
+    "governmentProgramName",
+    "governmentSubProgramCode",
+    "governmentSubProgramName",
+)
+
+_programa_governo_rename_dict = MappingProxyType({
+    "governmentProgramCode": "Código Programa Governo",
+    "governmentProgramName": "Nome Programa Governo",
+    "governmentSubProgramCode": "Código SubPrograma Governo",
+    "governmentSubProgramName": "Nome SubPrograma Governo",
+})
+
+_programa_governo_categorical_cols = (
+    "Nome Programa Governo",
+    "Nome SubPrograma Governo",
+)
+
+_extrato_programa_governo_explodeables = (
+    "expensesDocuments",
+)
+
+_extrato_programa_governo_rename_dict = MappingProxyType({
+    **_programa_governo_rename_dict,
+    "id": "ID Transação",
+    "bookingDate": "Data Agendamento",
+    "orderIndex": "Índice Ordem",
+    "valueDate": "Data Valor",
+    "referenceNumber": "Número Referência",
+    "value": "Valor",
+    "accountBalance": "Saldo Conta",
+    "descriptionCode": "Código Descrição",
+    "descriptionName": "Nome Descrição",
+    "descriptionBatchNumber": "Número Lote Descrição",
+    "creditDebitIndicator": "Indicador Crédito Débito",
+    "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
+    "beneficiaryBranchCode": "Código Agência Beneficiário",
+    "beneficiaryAccountNumber": "Número Conta Beneficiário",
+    "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
+    "beneficiaryDocumentId": "ID Documento Beneficiário",
+    "beneficiaryName": "Nome Beneficiário",
+    "pendingExpenseConciliation": "Conciliação Despesa Pendente",
+    "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
+    "expenseCategoryCode": "Código Categoria Despesa",
+    "expenseIdentificationStatus": "Status Identificação Despesa",
+    "subTransactionQuantity": "Quantidade Subtransações",
+    "bankOrderRuleCode": "Código Ordem Pagamento Banco",
+    "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
+    "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
+    "expenseSequentialNumber": "Número Sequencial Despesa",
+    "expensesCategory": "Categoria Despesa",
+    "expensesDocuments": "ID Documento Despesa",
+})
+
+_extrato_programa_governo_categorical_cols = (
+    *_programa_governo_categorical_cols,
+    "Tipo Pessoa Beneficiário",
+    "Indicador Crédito Débito",
+)
+
+_extrato_programa_governo_date_cols = MappingProxyType({
+    "Data Agendamento": "ISO8601",
+    "Data Valor": "ISO8601",
+})
+
+_documento_despesas_issuer_rename_dict = MappingProxyType({
+    "corporateTaxPayerRegistry": "CNPJ",
+    "individualTaxPayerRegistry": "CPF",
+    "stateRegistrationNumber": "RG",
+    "legalName": "Nome Legal",
+    "tradeName": "Nome Social",
+    "countryName": "Nacionalidade",
+    "stateAbbreviation": "UF",
+    "cityName": "Cidade",
+    "districtName": "Bairro",
+    "additionalAddressInformation": "Endereço",
+    "postalCode": "CEP",
+    "phoneNumber": "Telefone",
+})
+
+_documento_despesas_recipient_rename_dict = MappingProxyType({
+    "corporateTaxPayerRegistry": "CNPJ",
+    "individualTaxPayerRegistry": "CPF",
+    "stateRegistrationNumber": "RG",
+    "legalName": "Nome Legal",
+    "tradeName": "Nome Social",
+    "countryName": "Nacionalidade",
+    "stateAbbreviation": "UF",
+    "cityName": "Cidade",
+    "districtName": "Bairro",
+    "additionalAddressInformation": "Endereço",
+    "postalCode": "CEP",
+    "phoneNumber": "Telefone",
+    "presenceTypeCode": "Código Tipo Presença",
+    "typeConsumerCode": "Código Tipo Consumidor",
+})
+
+_documento_despesas_document_insertables = (
+    "accessKey",
+    "receiptTypeCode",
+    "typeCode",
+    "serialCode",
+    "number",
+    "issueDate",
+    "movementDate",
+    "itemDeliveryDate",
+    "value",
+    "operationTypeName",
+    "operation",
+    "paymentMethod",
+    "digitalSignatureCode",
+    "pronafAbilityRegistration",
+    "timestamp",
+    "userId",
+    "discountValue",
+    "totalDiscountValue",
+    "realeaseInstrumentCode",
+    "realeaseInstrumentName",
+    "realeaseInstrumentDate",
+    "additionalInformation",
+)
+
+_documento_despesas_document_rename_dict = MappingProxyType({
+    "accessKey": "Chave Acesso",
+    "receiptTypeCode": "Código Tipo Recibo",
+    "typeCode": "Código Tipo",
+    "serialCode": "Código Série",
+    "number": "Número",
+    "issueDate": "Data Emissão",
+    "movementDate": "Data Movimentação",
+    "itemDeliveryDate": "Data Entrega",
+    "value": "Valor",
+    "operationTypeName": "Nome Tipo Operação",
+    "operation": "Operação",
+    "paymentMethod": "Método Pagamento",
+    "digitalSignatureCode": "Código Assinatura Digital",
+    "pronafAbilityRegistration": "Registro Habilidade Pronaf",
+    "timestamp": "Momento",
+    "userId": "ID Usuário",
+    "discountValue": "Valor Desconto",
+    "totalDiscountValue": "Valor Total Desconto",
+    "realeaseInstrumentCode": "Código Liberação de Instrumento",
+    "realeaseInstrumentName": "Nome Liberação Instrumento",
+    "realeaseInstrumentDate": "Data Liberação Instrumento",
+    "additionalInformation": "Informação Adicional",
+    "description": "Descrição Item",
+    "quantity": "Quantidade Item",
+    "metric": "Métrica Item",
+    "unitValue": "Valor Unitário Item",
+    "totalValue": "Valor Total Item",
+    "mercosurCommonNameId": "ID Nome Comum Mercosul",
+    "itemDiscountValue": "Valor Desconto Item",
+})
+
+_documento_despesas_document_date_cols = MappingProxyType({
+    "Data Emissão": "ISO8601",
+    "Data Movimentação": "ISO8601",
+    "Data Entrega": "ISO8601",
+    "Data Liberação Instrumento": "ISO8601",
+})
+
+_documento_despesas_specs = (
+    (
+        "issuer",
+        MappingProxyType({
+            "rename_dict": _documento_despesas_issuer_rename_dict,
+        }),
+    ),
+    (
+        "recipient",
+        MappingProxyType({
+            "rename_dict": _documento_despesas_recipient_rename_dict,
+        }),
+    ),
+    (
+        "expenseDocument",
+        MappingProxyType({
+            "main_list": "items",
+            "insertables": _documento_despesas_document_insertables,
+            "rename_dict": _documento_despesas_document_rename_dict,
+            "date_cols": _documento_despesas_document_date_cols,
+        }),
+    ),
+)
+
+_extrato_subtransacoes_programa_governo_explodeables = (
+    "expensesCategory",
+    "expensesDocuments",
+)
+
+_extrato_subtransacoes_programa_governo_rename_dict = MappingProxyType({
+    **_programa_governo_rename_dict,
+    "id": "ID",
+    "codeSubtransactionState": "Estado Código Subtransação",
+    "paymentState": "Estado Pagamento",
+    "paymentDate": "Data Pagamento",
+    "value": "Valor",
+    "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
+    "beneficiaryBranchCode": "Código Agência Beneficiário",
+    "beneficiaryAccountNumber": "Número Conta Beneficiário",
+    "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
+    "beneficiaryDocumentId": "ID Documento Beneficiário",
+    "beneficiaryName": "Nome Beneficiário",
+    "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
+    "expenseCategoryCode": "Código Categoria Despesa",
+    "subtransactionAccountabilityIndicator": "Indicador Contabilidade Subtransação",
+    "subtransactionAccountabilityName": "Nome Contabilidade Subtransação",
+    "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
+    "bankOrderRuleCode": "Código Ordem Pagamento Banco",
+    "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
+    "expenseSequentialNumber": "Número Sequencial Despesa",
+    "code": "Código Categoria Despesa",
+    "parentCode": "Código Pai Categoria Despesa",
+    "name": "Nome Categoria Despesa",
+    "expensesDocuments": "Documentos Despesa",
+})
+
+_extrato_subtransacoes_programa_governo_categorical_cols = (
+    *_programa_governo_categorical_cols,
+    "Tipo Pessoa Beneficiário",
+    "Estado Pagamento",
+)
+
+_extrato_subtransacoes_programa_governo_date_cols = MappingProxyType({
+    "Data Pagamento": "ISO8601",
+})
+
+_extrato_fundos_investimento_insertables = (
+    "numeroAgenciaRecebedora",
+    "digitoVerificadorContaRecebedora",
+    "numeroContaCorrenteRecebedora",
+    "numeroDigitoVerificadorContaCorrenteRecebedora",
+    "nomeClienteRecebedor",
+    "nomeFundoInvestimento",
+    "CNPJFundoInvestimento",
+    "valorCota",
+    "dataAfericaoValorCota",
+    "ultimaCotacaoCota",
+    "dataUltimaCotacaoCota",
+    "sinalRentabilidadeMes",
+    "valorRentabilidadeMes",
+    "sinalRentabilidadeAno",
+    "valorRentabilidadeAno",
+    "sinalRentabilidadeResgateTotal",
+    "valorRentabilidadeResgateTotal",
+    "valorDisponivelResgate",
+    "valorCarenciaResgate",
+    "valorIRPrevisto",
+    "percentualIRPrevisto",
+    "valorIRComplementarPrevisto",
+    "valorIOFPrevisto",
+    "valorTaxaSaida",
+    "valorBonusDesempenho",
+    "valorBloqueado",
+    "valorAplicado",
+    "valorResgate",
+    "valorSaldoAnterior",
+    "quantidadeCotaAnterior",
+    "dataSaldoAnterior",
+    "valorTotalAplicadoPeriodo",
+    "valorTotalResgatadoPeriodo",
+    "sinalRendimentoBrutoPeriodo",
+    "valorRendimentoBrutoPeriodo",
+    "valorTotalIRPeriodo",
+    "valorTotalIOFPeriodo",
+    "valorTotalTaxaSaidaPeriodo",
+    "valorTotalBonusDesempenhoPeriodo",
+    "sinalRendimentoLiquido",
+    "valorRendimentoLiquido",
+    "valorSaldoMesAnterior",
+    "quantidadeCotaMesAnterior",
+    "dataSaldoMesAnterior",
+    "numeroLancamento",
+    "codigoProgramaGoverno",
+    "nomeProgramaGoverno",
+    "codigoSubProgramaGoverno",
+    "nomeSubProgramaGoverno",
+)
+
+_extrato_fundos_investimento_rename_dict = MappingProxyType({
+    "numeroAgenciaRecebedora": "Número Agência Recebedora",
+    "digitoVerificadorContaRecebedora": "Dígito Verificador Conta Recebedora",
+    "numeroContaCorrenteRecebedora": "Número Conta Corrente Recebedora",
+    "numeroDigitoVerificadorContaCorrenteRecebedora": "Número Dígito Verificador Conta Corrente Recebedora",
+    "nomeClienteRecebedor": "Nome Cliente Recebedor",
+    "nomeFundoInvestimento": "Nome Fundo Investimento",
+    "CNPJFundoInvestimento": " CNPJ Fundo Investimento",
+    "valorCotaExtrato": "Valor Cota Extrato",
+    "dataAfericaoValorCota": "Data Afericão Valor Cota",
+    "ultimaCotacaoCota": "Última Cotação Cota",
+    "dataUltimaCotacaoCota": "Data Última Cotação Cota",
+    "sinalRentabilidadeMes": "Sinal Rentabilidade Mês",
+    "valorRentabilidadeMes": "Valor Rentabilidade Mês",
+    "sinalRentabilidadeAno": "Sinal Rentabilidade Ano",
+    "valorRentabilidadeAno": "Valor Rentabilidade Ano",
+    "sinalRentabilidadeResgateTotal": "Sinal Rentabilidade Resgate Total",
+    "valorRentabilidadeResgateTotal": "Valor Rentabilidade Resgate Total",
+    "valorDisponivelResgate": "Valor Disponível Resgate",
+    "valorCarenciaResgate": "Valor Carência Resgate",
+    "valorIRPrevisto": "Valor IR Previsto",
+    "percentualIRPrevisto": "Percentual IR Previsto",
+    "valorIRComplementarPrevisto": "Valor IR Complementar Previsto",
+    "valorIOFPrevisto": "Valor IOF Previsto",
+    "valorTaxaSaida": "Valor Taxa Saída",
+    "valorBonusDesempenho": "Valor Bônus Desempenho",
+    "valorBloqueado": "Valor Bloqueado",
+    "valorAplicado": "Valor Aplicado",
+    "valorResgate": "Valor Resgate",
+    "valorSaldoAnterior": "Valor Saldo Anterior",
+    "quantidadeCotaAnterior": "Quantidade Cota Anterior",
+    "dataSaldoAnterior": "Data Saldo Anterior",
+    "valorTotalAplicadoPeriodo": "Valor Total Aplicado Período",
+    "valorTotalResgatadoPeriodo": "Valor Total Resgatado Período",
+    "sinalRendimentoBrutoPeriodo": "Sinal Rendimento Bruto Período",
+    "valorRendimentoBrutoPeriodo": "Valor Rendimento Bruto Período",
+    "valorTotalIRPeriodo": "Valor Total IR Período",
+    "valorTotalIOFPeriodo": "Valor Total IOF Período",
+    "valorTotalTaxaSaidaPeriodo": "Valor Total Taxa Saída Período",
+    "valorTotalBonusDesempenhoPeriodo": "Valor Total Bônus Desempenho Período",
+    "sinalRendimentoLiquido": "Sinal Rendimento Líquido",
+    "valorRendimentoLiquido": "Valor Rendimento Líquido",
+    "valorSaldoMesAnterior": "Valor Saldo Mês Anterior",
+    "quantidadeCotaMesAnterior": "Quantidade Cota Mês Anterior",
+    "dataSaldoMesAnterior": "Data Saldo Mês Anterior",
+    "numeroLancamento": "Número Lançamento",
+    "dataLancamento": "Data Lançamento",
+    "descricao": "Descrição",
+    "valorLancamento": "Valor Lançamento",
+    "valorIR": "Valor IR",
+    "valorPrejuizo": "Valor Prejuízo",
+    "valorIOF": "Valor IOF",
+    "quantidadeCota": "Quantidade Cota",
+    "valorCota": "Valor Cota Lançamento",
+    "saldoCotas": "Saldo Cotas",
+    "valorBaseCalculoIR": "Valor Base Cálculo IR",
+    "numeroDocumentoLancamento": "Número Documento Lançamento",
+    "codigoProgramaGoverno": "Código Programa Governo",
+    "nomeProgramaGoverno": "Nome Programa Governo",
+    "codigoSubProgramaGoverno": "Código SubPrograma Governo",
+    "nomeSubProgramaGoverno": "Nome SubPrograma Governo",
+})
+
+_extrato_fundos_investimento_scalar_rename_dict = MappingProxyType({
+    "valorCota": "valorCotaExtrato",
+})
+
+_extrato_fundos_investimento_categorical_cols = (
+    *_programa_governo_categorical_cols,
+    "Nome Fundo Investimento",
+)
+
+_agencias_proximas_insertables = (
+    "quantidadeAgencia",
+)
+
+_agencias_proximas_rename_dict = MappingProxyType({
+    "quantidadeAgencia": "Quantidade Agências",
+    "codigo": "Código",
+    "digito": "Dígito",
+    "nome": "Nome",
+    "cep": "CEP",
+    "logradouro": "Logradouro",
+    "bairro": "Bairro",
+    "municipio": "Munícipio",
+    "siglaUF": "Sigla UF",
+    "sugerida": "Sugerida",
+})
+
+_extrato_poupanca_insertables = (
+    "codigoProgramaGoverno",
+    "nomeProgramaGoverno",
+    "codigoSubProgramaGoverno",
+    "nomeSubProgramaGoverno",
+    "nomeCliente",
+    "identificadorCliente",
+    "saldoAnterior",
+    "saldoAtual",
+    "saldoBloqueado",
+    "saldoDisponivel",
+)
+
+_extrato_poupanca_rename_dict = MappingProxyType({
+    "codigoProgramaGoverno": "Código Programa Governo",
+    "nomeProgramaGoverno": "Nome Programa Governo",
+    "codigoSubProgramaGoverno": "Código SubPrograma Governo",
+    "nomeSubProgramaGoverno": "Nome SubPrograma Governo",
+    "nomeCliente": "Nome Cliente",
+    "identificadorCliente": "Identificador Cliente",
+    "saldoAnterior": "Saldo Anterior",
+    "saldoAtual": "Saldo Atual",
+    "saldoBloqueado": "Saldo Bloqueado",
+    "saldoDisponivel": "Saldo Disponível",
+    "dataLancamento": "Data Lançamento",
+    "dataMovimento": "Data Movimento",
+    "diaLancamento": "Dia Lançamento",
+    "codigoHistorico": "Código Histórico",
+    "descricaoHistorico": "Descrição Histórico",
+    "indicadorDebitoCredito": "Indicador Débito Crédito",
+    "agenciaOrigem": "Agência Origem",
+    "numeroDocumento": "Número Documento",
+    "valorLancamento": "Valor Lançamento",
+})
+
+_extrato_poupanca_categorical_cols = (
+    *_programa_governo_categorical_cols,
+    "Código Histórico",
+    "Descrição Histórico",
+    "Indicador Débito Crédito",
+)
+
+_lancamentos_atualizados_insertables = (
+    "totalPaginas",
+)
+
+_lancamentos_atualizados_rename_dict = MappingProxyType({
+    "totalPaginas": "Total Páginas",
+    "agencia": "Agência",
+    "contaCorrente": "Conta Corrente",
+    "sequencialLancamento": "Sequencial Lançamento",
+})
+
+_sublancamentos_atualizados_insertables = (
+    "totalPaginas",
+)
+
+_sublancamentos_atualizados_rename_dict = MappingProxyType({
+    "totalPaginas": "Total Páginas",
+    "agencia": "Agência",
+    "contaCorrente": "Conta Corrente",
+    "sequencialLancamento": "Sequencial Lançamento",
+    "sequencialSublancamento": "Sequencial Sublançamento",
+})
+
+_categorias_programa_governo_rename_dict = MappingProxyType({
+    "codigo": "Código Categoria",
+    "nome": "Nome Categoria",
+    "codigoCategoriaAgrupadora": "Código Categoria Agrupadora",
+    "indicadorDespesaAtiva": "Indicador Despesa Ativa",
+})
+
+_saldo_aplicacoes_financeiras_insertables = (
+    "dataSaldo",
+    "valorDisponibilidade",
+)
+
+_saldo_aplicacoes_financeiras_rename_dict = MappingProxyType({
+    "dataSaldo": "Data Saldo",
+    "valorDisponibilidade": "Valor Disponibilidade",
+    "codigo": "Código",
+    "valor": "Valor",
+    "indicadorSaldoNaoDisponivel": "Indicador Saldo Não Disponível",
+    "mensagemSaldoApurado": "Mensagem Saldo Apurado",
+})
+
+_saldo_conta_corrente_rename_dict = MappingProxyType({
+    "dataSaldo": "Data Saldo",
+    "valorDisponibilidade": "Valor Disponibilidade",
+})
+
+_post_categoria_despesa_lancamento_credito_rename_dict = MappingProxyType({
+    "timestampInclusaoCategoriaDespesa": "Momento Inclusão Categoria Despesa",
+})
+
+_post_identificacao_lancamento_credito_rename_dict = MappingProxyType({
+    "numeroSequencialLancamentoContaCorrente": "Número Sequencial Lançamento Conta Corrente",
+    "numeroSequencialIdentificacaoLancamento": "Número Sequencial Identificação Lançamento",
+    "timestampInclusaoIdentificacaoLancamento": "Momento Inclusão Identificação Lançamento",
+})
+
+_delete_identificacao_lancamento_credito_rename_dict = MappingProxyType({
+    "timestampExclusaoIdentificacaoLancamento": "Momento Exclusão Identificação Lançamento",
+})
+
+_identificacao_lancamento_debito_insertables = (
+    "numeroPaginaTotal",
+    "quantidadeIdentificacaoLancamento",
+)
+
+_identificacao_lancamento_debito_rename_dict = MappingProxyType({
+    "numeroPaginaTotal": "Número Página Total",
+    "quantidadeIdentificacaoLancamento": "Quantidade Identificação Lançamento",
+    "numeroSequencialLancamentoContaCorrente": "Número Sequencial Lançamento Conta Corrente",
+    "numeroSequencialIdentificacaoLancamento": "Número Sequencial Identificação Lançamento",
+    "tipoIdentificacao": "Tipo Identificação",
+    "tipoIdentificacaoTexto": "Tipo Identificação Texto",
+    "codigoIdentificacao": "Código Identificação",
+    "numeroCompanhia": "Número Companhia",
+    "valorFracionado": "Valor Fracionado",
+})
+
+_identificacao_lancamento_debito_categorical_cols = (
+    "Tipo Identificação Texto",
+)
+
+
+_contas_correntes_insertables = (
+    "numeroRegistroConsultar",
+    "quantidadeContaCorrente",
+)
+
+_contas_correntes_rename_dict = MappingProxyType({
+    "numeroRegistroConsultar": "Número Registro Consultar",
+    "quantidadeContaCorrente": "Quantidade Conta Corrente",
+    "codigoProgramaGoverno": "Código Programa Governo",
+    "nomeProgramaGoverno": "Nome Programa Governo",
+    "cnpj": "CNPJ",
+    "agencia": "Agência",
+    "nomeAgencia": "Nome Agência",
+    "contaCorrente": "Conta Corrente",
+})
+
+
+_accountability_paths = MappingProxyType({
+    "agencias_proximas": "/accountability/v3/agencias-proximas",
+    "extrato_programa_governo": "/accountability/v3/statements/{branch_code}-{account_number}",
+    "documento_despesas_programa_governo": "/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/documents/{document_id}",
+    "documento_despesas_prestacao_contas": "/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/subTransactions/{subtransaction_id}/documents/{document_id}",
+    "extrato_subtransacoes_programa_governo": "/accountability/v3/statements/{branch_code}-{account_number}/debits/{id}/subtransactions",
+    "extrato_fundos_investimento": "/accountability/v3/extratos/{agencia}-{conta_corrente}/fundos-investimentos/{fundo_investimento_id}",
+    "extrato_poupanca": "/accountability/v3/extratos/{agencia}-{conta_corrente}/poupanca/{variacao_poupanca}",
+    "lancamentos_atualizados": "/accountability/v3/programas-governo/{numero_programa_governo}/orgaos-repasse/lancamentos-atualizados",
+    "sublancamentos_atualizados": "/accountability/v3/programas-governo/{numero_programa_governo}/orgaos-repasse/sublancamentos-atualizados",
+    "categorias_programa_governo": "/accountability/v3/programas-governo/{numero_programa_governo}/categorias",
+    "saldo_aplicacoes_financeiras": "/accountability/v3/saldos/{agencia}-{conta_corrente}/aplicacoes-financeiras",
+    "saldo_conta_corrente": "/accountability/v3/saldos/{agencia}-{conta_corrente}/conta-corrente",
+    "post_categoria_despesa_lancamento_credito": "/accountability/v3/orgaos-repasse/lancamentos-credito/{ordem_bancaria}-{item}/categorias-despesa",
+    "post_identificacao_lancamento_credito": "/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-credito",
+    "delete_identificacao_lancamento_credito": "/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-credito/{sequencial_lancamento}-{sequencial_identificacao}",
+    "identificacao_lancamento_debito": "/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-debito",
+    "extrato_programa_governo_controle": "/accountability/v3/statements/{branch_code}-{account_number}/control-agencies",
+    "extrato_subtransacoes_programa_governo_controle": "/accountability/v3/statements/{branch_code}-{account_number}/debits/{id}/control-agencies/subtransactions",
+    "extrato_fundos_investimento_controle": "/accountability/v3/extratos/{agencia}-{conta_corrente}/fundos-investimentos/{fundo_investimento_id}/control-agencies",
+    "extrato_poupanca_controle": "/accountability/v3/extratos/{agencia}-{conta_corrente}/poupanca/{variacao_poupanca}/orgao-controle",
+    "contas_correntes": "/accountability/v3/conta-corrente/orgaos-controle",
+})
+
+
 class _AccountabilityV3BaseAPI:
+    __slots__ = (
+        "_app_key",
+        "_client_id",
+        "_api_domain",
+        "_access_token",
+        "_oauth_domain",
+        "_client_secret",
+        "_ambiente",
+        "_base64_credentials",
+        "_oauth_headers",
+        "_last_access_token_request_timestamp",
+        "_access_token_expires_at",
+        "_refresh_token",
+        "_token_lock",
+        "_headers",
+        "_urls",
+        "_session",
+    )
+
     _app_key: str
     _client_id: str
     _api_domain: str
@@ -16,7 +578,19 @@ class _AccountabilityV3BaseAPI:
     _client_secret: str
     _ambiente: common.Ambiente
     _base64_credentials: str
-    _last_access_token_request_timestamp: datetime.datetime
+    _oauth_headers: Dict[str, str]
+    _last_access_token_request_timestamp: float
+    _access_token_expires_at: float
+    _refresh_token: str
+    _token_lock: threading.Lock
+    _headers: Mapping[str, str]
+    _urls: Dict[str, str]
+    _session: requests.Session
+
+    _client_credentials_data = MappingProxyType({
+        "grant_type": "client_credentials",
+        "scope": "accountability.statements",
+    })
 
     def __init__(
         self,
@@ -40,18 +614,7 @@ class _AccountabilityV3BaseAPI:
         """
         self._ambiente = ambiente
 
-        if ambiente == common.Ambiente.DESENVOLVIMENTO:
-            self._api_domain = common._dese_api_domain
-            self._oauth_domain = common._dese_oauth_domain
-        elif ambiente == common.Ambiente.HOMOLOGACAO:
-            self._api_domain = common._homo_api_domain
-            self._oauth_domain = common._homo_oauth_domain
-        elif ambiente == common.Ambiente.HOMOLOGACAO_ALTERNATIVO:
-            self._api_domain = common._homo_alt_api_domain
-            self._oauth_domain = common._homo_alt_oauth_domain
-        elif ambiente == common.Ambiente.PRODUCAO:
-            self._api_domain = common._prod_api_domain
-            self._oauth_domain = common._prod_oauth_domain
+        self._api_domain, self._oauth_domain = common._ambiente_domains[ambiente]
 
         app_key = os.getenv("BB_API_APP_KEY", app_key)
         if app_key is not None:
@@ -91,93 +654,325 @@ class _AccountabilityV3BaseAPI:
             .decode("utf-8")
         )
         self._base64_credentials = base64_credentials
+        self._oauth_headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": f"Basic {base64_credentials}",
+        }
         self._last_access_token_request_timestamp = None
+        self._access_token_expires_at = 0.0
+        self._refresh_token = None
+        self._token_lock = threading.Lock()
+
+        adapter = HTTPAdapter(
+            pool_connections=common._http_pool_connections,
+            pool_maxsize=common._http_pool_maxsize,
+            max_retries=common._http_max_retries,
+        )
+        self._urls = {
+            "token": f"{self._oauth_domain}/oauth/token",
+            **{
+                key: f"{self._api_domain}{path}"
+                for key, path in _accountability_paths.items()
+            },
+        }
 
-    def _check_and_update_access_token(self) -> str:
-        now = datetime.datetime.now()
+        self._session = requests.Session()
+        self._session.params = {
+            "gw-dev-app-key": self._app_key,
+        }
+        self._session.mount(f"{self._oauth_domain}/", adapter)
+        self._session.mount(f"{self._api_domain}/", adapter)
+        self._session.hooks["response"].append(self._retry_on_expired_access_token)
 
-        is_first_access_token_request = self._last_access_token_request_timestamp is None
+    def __enter__(self):
+        return self
 
-        if is_first_access_token_request:
-            diff_between_requests = datetime.timedelta(0)
-        else:
-            diff_between_requests = now - self._last_access_token_request_timestamp
-
-        is_access_token_expired = diff_between_requests > common._time_between_access_token_requests
-
-        if is_first_access_token_request or is_access_token_expired:
-            res = requests.request(
-                "POST",
-                f"{self._oauth_domain}/oauth/token",
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Authorization": f"Basic {self._base64_credentials}",
-                },
-                data={
-                    "grant_type": "client_credentials",
-                    "scope": "accountability.statements",
-                },
-            )
+    def __exit__(self, *args):
+        self.close()
 
-            if res.status_code != 200:
-                common._handle_error(res.json())
-                raise Exception(
-                    "Não foi possível adquirir as novas credenciais de acesso."
-                )
+    def close(self):
+        """Encerra as conexões abertas com a API do Banco do Brasil."""
+        self._session.close()
 
-            res = res.json()
-            self._access_token = res["access_token"]
-            self._last_access_token_request_timestamp = datetime.datetime.now()
+    def _request_access_token(self, data: Mapping[str, str]) -> requests.Response:
+        return self._session.post(
+            self._urls["token"],
+            headers=self._oauth_headers,
+            params={
+                "gw-dev-app-key": None,
+            },
+            data=data,
+        )
+
+    def _is_access_token_expired(self, now: float) -> bool:
+        return (
+            self._last_access_token_request_timestamp is None
+            or now >= self._access_token_expires_at
+        )
+
+    def _check_and_update_access_token(self) -> str:
+        if not self._is_access_token_expired(time.monotonic()):
+            return
+
+        with self._token_lock:
+            now = time.monotonic()
+
+            if self._is_access_token_expired(now):
+                res = None
+
+                if self._refresh_token is not None:
+                    res = self._request_access_token({
+                        "grant_type": "refresh_token",
+                        "refresh_token": self._refresh_token,
+                    })
+
+                    if res.status_code in [400, 401]:
+                        self._refresh_token = None
+                        res = None
+
+                if res is None:
+                    res = self._request_access_token(self._client_credentials_data)
+
+                if not res.ok:
+                    raise common.BBAuthError.from_response(
+                        res,
+                        "Não foi possível adquirir as novas credenciais de acesso.",
+                    )
+
+                res = common._decode(res)
+                self._access_token = res["access_token"]
+                self._headers = common._get_headers(self._access_token)
+                self._refresh_token = res.get("refresh_token", self._refresh_token)
+                self._last_access_token_request_timestamp = now
+                self._access_token_expires_at = (
+                    now
+                    + res.get(
+                        "expires_in",
+                        common._time_between_access_token_requests.total_seconds(),
+                    )
+                    - common._access_token_expiration_margin.total_seconds()
+                )
 
     def _get_access_token(self) -> str:
         self._check_and_update_access_token()
         return self._access_token
 
+    def _get_headers(self) -> Mapping[str, str]:
+        self._check_and_update_access_token()
+        return self._headers
+
+    def _retry_on_expired_access_token(
+        self,
+        res: requests.Response,
+        *args,
+        **kwargs,
+    ) -> requests.Response:
+        if (
+            res.status_code != 401
+            or "WWW-Authenticate" not in res.headers
+            or res.request.url.startswith(self._urls["token"])
+        ):
+            return res
+
+        # Só força a renovação se o token recusado ainda for o atual; caso
+        # contrário, outra chamada já o renovou.
+        if res.request.headers.get("Authorization") == self._headers["Authorization"]:
+            self._access_token_expires_at = 0.0
+
+        # Consome e fecha a resposta recusada para devolver a conexão ao pool
+        # antes de repetir a requisição.
+        res.content
+        res.close()
+
+        request = res.request.copy()
+        request.headers.update(self._get_headers())
+        request.hooks = {
+            "response": [
+                hook
+                for hook in request.hooks["response"]
+                if hook != self._retry_on_expired_access_token
+            ],
+        }
+
+        new_res = self._session.send(request, **kwargs)
+        new_res.history.append(res)
+
+        return new_res
+
+    def _get_documento_despesas(
+        self,
+        url: str,
+        booking_date: common.DateLike,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        headers = self._get_headers()
+        booking_date = common._handle_dates(booking_date)
+
+        res = self._session.get(
+            url,
+            headers=headers,
+            params={
+                "bookingDate": booking_date,
+            },
+        )
+
+        common._check_ok(
+            res,
+            "Não foi possível reaver o extrato do órgão repassador.",
+        )
+
+        res = common._decode(res)
+        return common._handle_results_many(
+            res,
+            _documento_despesas_specs,
+        )
+
+    def get_documento_despesas_programa_governo(
+        self,
+        branch_code: int,
+        account_number: int,
+        transaction_id: int,
+        document_id: int,
+        booking_date: common.DateLike,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        return self._get_documento_despesas(
+            self._urls["documento_despesas_programa_governo"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+                transaction_id=transaction_id,
+                document_id=document_id,
+            ),
+            booking_date,
+        )
+
+    def get_documento_despesas_prestacao_contas(
+        self,
+        branch_code: int,
+        account_number: int,
+        transaction_id: int,
+        subtransaction_id: int,
+        document_id: int,
+        booking_date: common.DateLike,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        return self._get_documento_despesas(
+            self._urls["documento_despesas_prestacao_contas"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+                transaction_id=transaction_id,
+                subtransaction_id=subtransaction_id,
+                document_id=document_id,
+            ),
+            booking_date,
+        )
+
+    def _get_all_pages(
+        self,
+        get_page: Callable[[int], pd.DataFrame],
+        total_pages_column: str,
+    ) -> pd.DataFrame:
+        df = get_page(1)
+
+        if df.empty:
+            return df
+
+        total_pages = int(df[total_pages_column].iloc[0])
+
+        if total_pages <= 1:
+            return df
+
+        with ThreadPoolExecutor(
+            max_workers=common._max_concurrent_requests
+        ) as executor:
+            dfs = list(executor.map(get_page, range(2, total_pages + 1)))
+
+        categorical_cols = [
+            column
+            for column in df.columns
+            if isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+
+        df = pd.concat([df, *dfs], ignore_index=True)
+
+        for column in categorical_cols:
+            df[column] = df[column].astype("category")
+
+        return df
+
+    def get_documento_despesas_programa_governo_many(
+        self,
+        items: Sequence[Tuple[int, int, int, int, common.DateLike]],
+    ) -> List[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """Busca vários documentos de despesas de forma concorrente.
+
+        Cada item de ``items`` contém os argumentos de
+        ``get_documento_despesas_programa_governo`` na mesma ordem e os
+        resultados são retornados na ordem dos itens.
+        """
+        self._get_access_token()
+
+        with ThreadPoolExecutor(
+            max_workers=common._max_concurrent_requests
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda item: self.get_documento_despesas_programa_governo(*item),
+                    items,
+                )
+            )
+
+    def get_documento_despesas_programa_governo_concat(
+        self,
+        items: Sequence[Tuple[int, int, int, int, common.DateLike]],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Busca vários documentos de despesas de forma concorrente e junta os
+        resultados.
+
+        Funciona como ``get_documento_despesas_programa_governo_many``, mas
+        retorna apenas três tabelas (emitentes, destinatários e documentos),
+        cada uma com as linhas de todos os itens na ordem dos itens.
+        """
+        results = self.get_documento_despesas_programa_governo_many(items)
+
+        if not results:
+            return (
+                pd.DataFrame(),
+                pd.DataFrame(),
+                pd.DataFrame(),
+            )
+
+        return tuple(
+            pd.concat(frames, ignore_index=True)
+            for frames in zip(*results)
+        )
+
     def get_agencias_proximas(
         self,
         cnpj: str,
         cep: str,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         cnpj = common._handle_numeric_string_with_symbols(cnpj)
         cep = common._handle_numeric_string_with_symbols(cep)
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/agencias-proximas",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["agencias_proximas"],
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "cnpj": cnpj,
                 "cep": cep,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaAgencia",
-            insertables=[
-                "quantidadeAgencia",
-            ],
-            rename_dict={
-                "quantidadeAgencia": "Quantidade Agências",
-                "codigo": "Código",
-                "digito": "Dígito",
-                "nome": "Nome",
-                "cep": "CEP",
-                "logradouro": "Logradouro",
-                "bairro": "Bairro",
-                "municipio": "Munícipio",
-                "siglaUF": "Sigla UF",
-                "sugerida": "Sugerida",
-            },
+            insertables=_agencias_proximas_insertables,
+            rename_dict=_agencias_proximas_rename_dict,
         )
 
 
@@ -185,10 +980,17 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
     """Representa um encapsulador da API Accountability V3 do Banco do Brasil
     para os órgaos de repasse.
 
-    Esse encapsulador já reutiliza o token de acesso por 10 minutos e gera um
-    novo sempre que o atual estiver expirado.
+    Esse encapsulador já reutiliza o token de acesso durante o tempo de
+    expiração informado pelo Banco do Brasil e gera um novo sempre que o atual
+    estiver expirado.
     """
 
+    __slots__ = (
+        "_categorias_programa_governo_cache",
+    )
+
+    _categorias_programa_governo_cache: Dict[int, Tuple[float, pd.DataFrame]]
+
     def __init__(
         self,
         ambiente: common.Ambiente = common.Ambiente.HOMOLOGACAO,
@@ -203,6 +1005,8 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
             client_secret,
         )
 
+        self._categorias_programa_governo_cache = {}
+
     def get_extrato_programa_governo(
         self,
         branch_code: int,
@@ -210,342 +1014,37 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         start_date: common.DateLike,
         end_date: common.DateLike,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         start_date = common._handle_dates(start_date)
         end_date = common._handle_dates(end_date)
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/statements/{branch_code}-{account_number}",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["extrato_programa_governo"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+            ),
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "startDate": start_date,
                 "endDate": end_date,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível reaver o extrato do órgão repassador.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
 
         return common._handle_results(
             res,
             main_list="transactions",
-            insertables=[
-                "governmentProgramCode",
-                "governmentProgramName",
-                "governmentSubProgramCode",
-                "governmentSubProgramName",
-            ],
-            explodeables=[
-                "expensesDocuments",
-            ],
-            rename_dict={
-                "governmentProgramCode": "Código Programa Governo",
-                "governmentProgramName": "Nome Programa Governo",
-                "governmentSubProgramCode": "Código SubPrograma Governo",
-                "governmentSubProgramName": "Nome SubPrograma Governo",
-                "id": "ID Transação",
-                "bookingDate": "Data Agendamento",
-                "orderIndex": "Índice Ordem",
-                "valueDate": "Data Valor",
-                "referenceNumber": "Número Referência",
-                "value": "Valor",
-                "accountBalance": "Saldo Conta",
-                "descriptionCode": "Código Descrição",
-                "descriptionName": "Nome Descrição",
-                "descriptionBatchNumber": "Número Lote Descrição",
-                "creditDebitIndicator": "Indicador Crédito Débito",
-                "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
-                "beneficiaryBranchCode": "Código Agência Beneficiário",
-                "beneficiaryAccountNumber": "Número Conta Beneficiário",
-                "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
-                "beneficiaryDocumentId": "ID Documento Beneficiário",
-                "beneficiaryName": "Nome Beneficiário",
-                "pendingExpenseConciliation": "Conciliação Despesa Pendente",
-                "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
-                "expenseCategoryCode": "Código Categoria Despesa",
-                "expenseIdentificationStatus": "Status Identificação Despesa",
-                "subTransactionQuantity": "Quantidade Subtransações",
-                "bankOrderRuleCode": "Código Ordem Pagamento Banco",
-                "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
-                "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
-                "expenseSequentialNumber": "Número Sequencial Despesa",
-                "expensesCategory": "Categoria Despesa",
-                "expensesDocuments": "ID Documento Despesa",
-            },
-        )
-
-    def get_documento_despesas_programa_governo(
-        self,
-        branch_code: int,
-        account_number: int,
-        transaction_id: int,
-        document_id: int,
-        booking_date: common.DateLike,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        access_token = self._get_access_token()
-        booking_date = common._handle_dates(booking_date)
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/documents/{document_id}",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-                "bookingDate": booking_date,
-            },
-        )
-
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
-
-        res = res.json()
-
-        df_issuer = common._handle_results(
-            res["issuer"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-            },
-        )
-
-        df_recipient = common._handle_results(
-            res["recipient"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-                "presenceTypeCode": "Código Tipo Presença",
-                "typeConsumerCode": "Código Tipo Consumidor",
-            },
-        )
-
-        df_document = common._handle_results(
-            res["expenseDocument"],
-            main_list="items",
-            insertables=[
-                "accessKey",
-                "receiptTypeCode",
-                "typeCode",
-                "serialCode",
-                "number",
-                "issueDate",
-                "movementDate",
-                "itemDeliveryDate",
-                "value",
-                "operationTypeName",
-                "operation",
-                "paymentMethod",
-                "digitalSignatureCode",
-                "pronafAbilityRegistration",
-                "timestamp",
-                "userId",
-                "discountValue",
-                "totalDiscountValue",
-                "realeaseInstrumentCode",
-                "realeaseInstrumentName",
-                "realeaseInstrumentDate",
-                "additionalInformation",
-            ],
-            rename_dict={
-                "accessKey": "Chave Acesso",
-                "receiptTypeCode": "Código Tipo Recibo",
-                "typeCode": "Código Tipo",
-                "serialCode": "Código Série",
-                "number": "Número",
-                "issueDate": "Data Emissão",
-                "movementDate": "Data Movimentação",
-                "itemDeliveryDate": "Data Entrega",
-                "value": "Valor",
-                "operationTypeName": "Nome Tipo Operação",
-                "operation": "Operação",
-                "paymentMethod": "Método Pagamento",
-                "digitalSignatureCode": "Código Assinatura Digital",
-                "pronafAbilityRegistration": "Registro Habilidade Pronaf",
-                "timestamp": "Momento",
-                "userId": "ID Usuário",
-                "discountValue": "Valor Desconto",
-                "totalDiscountValue": "Valor Total Desconto",
-                "realeaseInstrumentCode": "Código Liberação de Instrumento",
-                "realeaseInstrumentName": "Nome Liberação Instrumento",
-                "realeaseInstrumentDate": "Data Liberação Instrumento",
-                "additionalInformation": "Informação Adicional",
-                "description": "Descrição Item",
-                "quantity": "Quantidade Item",
-                "metric": "Métrica Item",
-                "unitValue": "Valor Unitário Item",
-                "totalValue": "Valor Total Item",
-                "mercosurCommonNameId": "ID Nome Comum Mercosul",
-                "itemDiscountValue": "Valor Desconto Item",
-            },
-        )
-
-        return (
-            df_issuer,
-            df_recipient,
-            df_document,
-        )
-
-    def get_documento_despesas_prestacao_contas(
-        self,
-        branch_code: int,
-        account_number: int,
-        transaction_id: int,
-        subtransaction_id: int,
-        document_id: int,
-        booking_date: common.DateLike,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        access_token = self._get_access_token()
-        booking_date = common._handle_dates(booking_date)
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/subTransactions/{subtransaction_id}/documents/{document_id}",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-                "bookingDate": booking_date,
-            },
-        )
-
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
-
-        res = res.json()
-
-        df_issuer = common._handle_results(
-            res["issuer"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-            },
-        )
-
-        df_recipient = common._handle_results(
-            res["recipient"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-                "presenceTypeCode": "Código Tipo Presença",
-                "typeConsumerCode": "Código Tipo Consumidor",
-            },
-        )
-
-        df_document = common._handle_results(
-            res["expenseDocument"],
-            main_list="items",
-            insertables=[
-                "accessKey",
-                "receiptTypeCode",
-                "typeCode",
-                "serialCode",
-                "number",
-                "issueDate",
-                "movementDate",
-                "itemDeliveryDate",
-                "value",
-                "operationTypeName",
-                "operation",
-                "paymentMethod",
-                "digitalSignatureCode",
-                "pronafAbilityRegistration",
-                "timestamp",
-                "userId",
-                "discountValue",
-                "totalDiscountValue",
-                "realeaseInstrumentCode",
-                "realeaseInstrumentName",
-                "realeaseInstrumentDate",
-                "additionalInformation",
-            ],
-            rename_dict={
-                "accessKey": "Chave Acesso",
-                "receiptTypeCode": "Código Tipo Recibo",
-                "typeCode": "Código Tipo",
-                "serialCode": "Código Série",
-                "number": "Número",
-                "issueDate": "Data Emissão",
-                "movementDate": "Data Movimentação",
-                "itemDeliveryDate": "Data Entrega",
-                "value": "Valor",
-                "operationTypeName": "Nome Tipo Operação",
-                "operation": "Operação",
-                "paymentMethod": "Método Pagamento",
-                "digitalSignatureCode": "Código Assinatura Digital",
-                "pronafAbilityRegistration": "Registro Habilidade Pronaf",
-                "timestamp": "Momento",
-                "userId": "ID Usuário",
-                "discountValue": "Valor Desconto",
-                "totalDiscountValue": "Valor Total Desconto",
-                "realeaseInstrumentCode": "Código Liberação de Instrumento",
-                "realeaseInstrumentName": "Nome Liberação Instrumento",
-                "realeaseInstrumentDate": "Data Liberação Instrumento",
-                "additionalInformation": "Informação Adicional",
-                "description": "Descrição Item",
-                "quantity": "Quantidade Item",
-                "metric": "Métrica Item",
-                "unitValue": "Valor Unitário Item",
-                "totalValue": "Valor Total Item",
-                "mercosurCommonNameId": "ID Nome Comum Mercosul",
-                "itemDiscountValue": "Valor Desconto Item",
-            },
-        )
-
-        return (
-            df_issuer,
-            df_recipient,
-            df_document,
+            insertables=_programa_governo_insertables,
+            explodeables=_extrato_programa_governo_explodeables,
+            rename_dict=_extrato_programa_governo_rename_dict,
+            categorical_cols=_extrato_programa_governo_categorical_cols,
+            date_cols=_extrato_programa_governo_date_cols,
         )
 
     def get_extrato_subtransacoes_programa_governo(
@@ -555,72 +1054,38 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         id: int,
         id_subtransaction: str = None,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
 
-        params = {
-            "gw-dev-app-key": self._app_key,
-        }
+        params = {}
 
         if id_subtransaction is not None:
             params["idSubtransaction"] = id_subtransaction
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/statements/{branch_code}-{account_number}/debits/{id}/subtransactions",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["extrato_subtransacoes_programa_governo"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+                id=id,
+            ),
+            headers=headers,
             params=params,
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível reaver o extrato do órgão repassador.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
 
         return common._handle_results(
             res,
             main_list="subtransactions",
-            insertables=[
-                "governmentProgramCode",
-                "governmentProgramName",
-                "governmentSubProgramCode",
-                "governmentSubProgramName",
-            ],
-            explodeables=[
-                "expensesCategory",
-                "expensesDocuments",
-            ],
-            rename_dict={
-                "governmentProgramCode": "Código Programa Governo",
-                "governmentProgramName": "Nome Programa Governo",
-                "governmentSubProgramCode": "Código SubPrograma Governo",
-                "governmentSubProgramName": "Nome SubPrograma Governo",
-                "id": "ID",
-                "codeSubtransactionState": "Estado Código Subtransação",
-                "paymentState": "Estado Pagamento",
-                "paymentDate": "Data Pagamento",
-                "value": "Valor",
-                "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
-                "beneficiaryBranchCode": "Código Agência Beneficiário",
-                "beneficiaryAccountNumber": "Número Conta Beneficiário",
-                "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
-                "beneficiaryDocumentId": "ID Documento Beneficiário",
-                "beneficiaryName": "Nome Beneficiário",
-                "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
-                "expenseCategoryCode": "Código Categoria Despesa",
-                "subtransactionAccountabilityIndicator": "Indicador Contabilidade Subtransação",
-                "subtransactionAccountabilityName": "Nome Contabilidade Subtransação",
-                "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
-                "bankOrderRuleCode": "Código Ordem Pagamento Banco",
-                "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
-                "expenseSequentialNumber": "Número Sequencial Despesa",
-                "code": "Código Categoria Despesa",
-                "parentCode": "Código Pai Categoria Despesa",
-                "name": "Nome Categoria Despesa",
-                "expensesDocuments": "Documentos Despesa",
-            },
+            insertables=_programa_governo_insertables,
+            explodeables=_extrato_subtransacoes_programa_governo_explodeables,
+            rename_dict=_extrato_subtransacoes_programa_governo_rename_dict,
+            categorical_cols=_extrato_subtransacoes_programa_governo_categorical_cols,
+            date_cols=_extrato_subtransacoes_programa_governo_date_cols,
         )
 
     def get_extrato_fundos_investimento(
@@ -631,144 +1096,39 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         mes: int,
         ano: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/extratos/{agencia}-{conta_corrente}/fundos-investimentos/{fundo_investimento_id}",
-            headers=common._get_headers(access_token),
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["extrato_fundos_investimento"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+                fundo_investimento_id=fundo_investimento_id,
+            ),
+            headers=headers,
             params={
                 "mes": mes,
                 "ano": ano,
-                "gw-dev-app-key": self._app_key,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
-        res["extrato"]["valorCotaExtrato"] = res["extrato"].pop("valorCota")
-        df = common._handle_results(
-            res["extrato"],
+        res = common._decode(res)
+        return common._handle_results(
+            ChainMap(
+                res["extrato"],
+                res,
+            ),
             main_list="listaLancamentosExtrato",
-            insertables=[
-                "numeroAgenciaRecebedora",
-                "digitoVerificadorContaRecebedora",
-                "numeroContaCorrenteRecebedora",
-                "numeroDigitoVerificadorContaCorrenteRecebedora",
-                "nomeClienteRecebedor",
-                "nomeFundoInvestimento",
-                "CNPJFundoInvestimento",
-                "valorCotaExtrato",
-                "dataAfericaoValorCota",
-                "ultimaCotacaoCota",
-                "dataUltimaCotacaoCota",
-                "sinalRentabilidadeMes",
-                "valorRentabilidadeMes",
-                "sinalRentabilidadeAno",
-                "valorRentabilidadeAno",
-                "sinalRentabilidadeResgateTotal",
-                "valorRentabilidadeResgateTotal",
-                "valorDisponivelResgate",
-                "valorCarenciaResgate",
-                "valorIRPrevisto",
-                "percentualIRPrevisto",
-                "valorIRComplementarPrevisto",
-                "valorIOFPrevisto",
-                "valorTaxaSaida",
-                "valorBonusDesempenho",
-                "valorBloqueado",
-                "valorAplicado",
-                "valorResgate",
-                "valorSaldoAnterior",
-                "quantidadeCotaAnterior",
-                "dataSaldoAnterior",
-                "valorTotalAplicadoPeriodo",
-                "valorTotalResgatadoPeriodo",
-                "sinalRendimentoBrutoPeriodo",
-                "valorRendimentoBrutoPeriodo",
-                "valorTotalIRPeriodo",
-                "valorTotalIOFPeriodo",
-                "valorTotalTaxaSaidaPeriodo",
-                "valorTotalBonusDesempenhoPeriodo",
-                "sinalRendimentoLiquido",
-                "valorRendimentoLiquido",
-                "valorSaldoMesAnterior",
-                "quantidadeCotaMesAnterior",
-                "dataSaldoMesAnterior",
-                "numeroLancamento",
-            ],
-            rename_dict={
-                "numeroAgenciaRecebedora": "Número Agência Recebedora",
-                "digitoVerificadorContaRecebedora": "Dígito Verificador Conta Recebedora",
-                "numeroContaCorrenteRecebedora": "Número Conta Corrente Recebedora",
-                "numeroDigitoVerificadorContaCorrenteRecebedora": "Número Dígito Verificador Conta Corrente Recebedora",
-                "nomeClienteRecebedor": "Nome Cliente Recebedor",
-                "nomeFundoInvestimento": "Nome Fundo Investimento",
-                "CNPJFundoInvestimento": " CNPJ Fundo Investimento",
-                "valorCotaExtrato": "Valor Cota Extrato",
-                "dataAfericaoValorCota": "Data Afericão Valor Cota",
-                "ultimaCotacaoCota": "Última Cotação Cota",
-                "dataUltimaCotacaoCota": "Data Última Cotação Cota",
-                "sinalRentabilidadeMes": "Sinal Rentabilidade Mês",
-                "valorRentabilidadeMes": "Valor Rentabilidade Mês",
-                "sinalRentabilidadeAno": "Sinal Rentabilidade Ano",
-                "valorRentabilidadeAno": "Valor Rentabilidade Ano",
-                "sinalRentabilidadeResgateTotal": "Sinal Rentabilidade Resgate Total",
-                "valorRentabilidadeResgateTotal": "Valor Rentabilidade Resgate Total",
-                "valorDisponivelResgate": "Valor Disponível Resgate",
-                "valorCarenciaResgate": "Valor Carência Resgate",
-                "valorIRPrevisto": "Valor IR Previsto",
-                "percentualIRPrevisto": "Percentual IR Previsto",
-                "valorIRComplementarPrevisto": "Valor IR Complementar Previsto",
-                "valorIOFPrevisto": "Valor IOF Previsto",
-                "valorTaxaSaida": "Valor Taxa Saída",
-                "valorBonusDesempenho": "Valor Bônus Desempenho",
-                "valorBloqueado": "Valor Bloqueado",
-                "valorAplicado": "Valor Aplicado",
-                "valorResgate": "Valor Resgate",
-                "valorSaldoAnterior": "Valor Saldo Anterior",
-                "quantidadeCotaAnterior": "Quantidade Cota Anterior",
-                "dataSaldoAnterior": "Data Saldo Anterior",
-                "valorTotalAplicadoPeriodo": "Valor Total Aplicado Período",
-                "valorTotalResgatadoPeriodo": "Valor Total Resgatado Período",
-                "sinalRendimentoBrutoPeriodo": "Sinal Rendimento Bruto Período",
-                "valorRendimentoBrutoPeriodo": "Valor Rendimento Bruto Período",
-                "valorTotalIRPeriodo": "Valor Total IR Período",
-                "valorTotalIOFPeriodo": "Valor Total IOF Período",
-                "valorTotalTaxaSaidaPeriodo": "Valor Total Taxa Saída Período",
-                "valorTotalBonusDesempenhoPeriodo": "Valor Total Bônus Desempenho Período",
-                "sinalRendimentoLiquido": "Sinal Rendimento Líquido",
-                "valorRendimentoLiquido": "Valor Rendimento Líquido",
-                "valorSaldoMesAnterior": "Valor Saldo Mês Anterior",
-                "quantidadeCotaMesAnterior": "Quantidade Cota Mês Anterior",
-                "dataSaldoMesAnterior": "Data Saldo Mês Anterior",
-                "numeroLancamento": "Número Lançamento",
-                "dataLancamento": "Data Lançamento",
-                "descricao": "Descrição",
-                "valorLancamento": "Valor Lançamento",
-                "valorIR": "Valor IR",
-                "valorPrejuizo": "Valor Prejuízo",
-                "valorIOF": "Valor IOF",
-                "quantidadeCota": "Quantidade Cota",
-                "valorCota": "Valor Cota Lançamento",
-                "saldoCotas": "Saldo Cotas",
-                "valorBaseCalculoIR": "Valor Base Cálculo IR",
-                "numeroDocumentoLancamento": "Número Documento Lançamento",
-            },
+            insertables=_extrato_fundos_investimento_insertables,
+            rename_dict=_extrato_fundos_investimento_rename_dict,
+            scalar_rename_dict=_extrato_fundos_investimento_scalar_rename_dict,
+            categorical_cols=_extrato_fundos_investimento_categorical_cols,
         )
 
-        df["Código Programa Governo"] = res["codigoProgramaGoverno"]
-        df["Nome Programa Governo"] = res["nomeProgramaGoverno"]
-        df["Código SubPrograma Governo"] = res["codigoSubProgramaGoverno"]
-        df["Nome SubPrograma Governo"] = res["nomeSubProgramaGoverno"]
-
-        return df
-
     def get_extrato_poupanca(
         self,
         agencia: int,
@@ -777,62 +1137,33 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         mes: int,
         ano: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/extratos/{agencia}-{conta_corrente}/poupanca/{variacao_poupanca}",
-            headers=common._get_headers(access_token),
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["extrato_poupanca"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+                variacao_poupanca=variacao_poupanca,
+            ),
+            headers=headers,
             params={
                 "mes": mes,
                 "ano": ano,
-                "gw-dev-app-key": self._app_key,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaLancamentos",
-            insertables=[
-                "codigoProgramaGoverno",
-                "nomeProgramaGoverno",
-                "codigoSubProgramaGoverno",
-                "nomeSubProgramaGoverno",
-                "nomeCliente",
-                "identificadorCliente",
-                "saldoAnterior",
-                "saldoAtual",
-                "saldoBloqueado",
-                "saldoDisponivel",
-            ],
-            rename_dict={
-                "codigoProgramaGoverno": "Código Programa Governo",
-                "nomeProgramaGoverno": "Nome Programa Governo",
-                "codigoSubProgramaGoverno": "Código SubPrograma Governo",
-                "nomeSubProgramaGoverno": "Nome SubPrograma Governo",
-                "nomeCliente": "Nome Cliente",
-                "identificadorCliente": "Identificador Cliente",
-                "saldoAnterior": "Saldo Anterior",
-                "saldoAtual": "Saldo Atual",
-                "saldoBloqueado": "Saldo Bloqueado",
-                "saldoDisponivel": "Saldo Disponível",
-                "dataLancamento": "Data Lançamento",
-                "dataMovimento": "Data Movimento",
-                "diaLancamento": "Dia Lançamento",
-                "codigoHistorico": "Código Histórico",
-                "descricaoHistorico": "Descrição Histórico",
-                "indicadorDebitoCredito": "Indicador Débito Crédito",
-                "agenciaOrigem": "Agência Origem",
-                "numeroDocumento": "Número Documento",
-                "valorLancamento": "Valor Lançamento",
-            },
+            insertables=_extrato_poupanca_insertables,
+            rename_dict=_extrato_poupanca_rename_dict,
+            categorical_cols=_extrato_poupanca_categorical_cols,
         )
 
     def get_lancamentos_atualizados(
@@ -842,41 +1173,54 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         data_fim: common.DateLike,
         pagina: int = 1,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         data_inicio = common._handle_dates(data_inicio)
         data_fim = common._handle_dates(data_fim)
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/programas-governo/{numero_programa_governo}/orgaos-repasse/lancamentos-atualizados",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["lancamentos_atualizados"].format(
+                numero_programa_governo=numero_programa_governo,
+            ),
+            headers=headers,
             params={
                 "dataInicio": data_inicio,
                 "dataFim": data_fim,
                 "pagina": pagina,
-                "gw-dev-app-key": self._app_key,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaLancamentos",
-            insertables=[
-                "totalPaginas",
-            ],
-            rename_dict={
-                "totalPaginas": "Total Páginas",
-                "agencia": "Agência",
-                "contaCorrente": "Conta Corrente",
-                "sequencialLancamento": "Sequencial Lançamento",
-            },
+            insertables=_lancamentos_atualizados_insertables,
+            rename_dict=_lancamentos_atualizados_rename_dict,
+        )
+
+    def get_lancamentos_atualizados_all(
+        self,
+        numero_programa_governo: int,
+        data_inicio: common.DateLike,
+        data_fim: common.DateLike,
+    ) -> pd.DataFrame:
+        """Busca todas as páginas de ``get_lancamentos_atualizados``.
+
+        A primeira página informa o total de páginas e as demais são buscadas
+        de forma concorrente, sendo concatenadas na ordem das páginas.
+        """
+        return self._get_all_pages(
+            lambda pagina: self.get_lancamentos_atualizados(
+                numero_programa_governo,
+                data_inicio,
+                data_fim,
+                pagina,
+            ),
+            "Total Páginas",
         )
 
     def get_sublancamentos_atualizados(
@@ -886,143 +1230,180 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         data_fim: common.DateLike,
         pagina: int = 1,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         data_inicio = common._handle_dates(data_inicio)
         data_fim = common._handle_dates(data_fim)
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/programas-governo/{numero_programa_governo}/orgaos-repasse/sublancamentos-atualizados",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["sublancamentos_atualizados"].format(
+                numero_programa_governo=numero_programa_governo,
+            ),
+            headers=headers,
             params={
                 "dataInicio": data_inicio,
                 "dataFim": data_fim,
                 "pagina": pagina,
-                "gw-dev-app-key": self._app_key,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaSublancamentos",
-            insertables=[
-                "totalPaginas",
-            ],
-            rename_dict={
-                "totalPaginas": "Total Páginas",
-                "agencia": "Agência",
-                "contaCorrente": "Conta Corrente",
-                "sequencialLancamento": "Sequencial Lançamento",
-                "sequencialSublancamento": "Sequencial Sublançamento",
-            },
+            insertables=_sublancamentos_atualizados_insertables,
+            rename_dict=_sublancamentos_atualizados_rename_dict,
+        )
+
+    def get_sublancamentos_atualizados_all(
+        self,
+        numero_programa_governo: int,
+        data_inicio: common.DateLike,
+        data_fim: common.DateLike,
+    ) -> pd.DataFrame:
+        """Busca todas as páginas de ``get_sublancamentos_atualizados``.
+
+        A primeira página informa o total de páginas e as demais são buscadas
+        de forma concorrente, sendo concatenadas na ordem das páginas.
+        """
+        return self._get_all_pages(
+            lambda pagina: self.get_sublancamentos_atualizados(
+                numero_programa_governo,
+                data_inicio,
+                data_fim,
+                pagina,
+            ),
+            "Total Páginas",
         )
 
     def get_categorias_programa_governo(
         self,
         numero_programa_governo: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        """Lista as categorias de despesa do programa de governo.
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/programas-governo/{numero_programa_governo}/categorias",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
+        As categorias mudam raramente, então o resultado de cada programa é
+        reaproveitado por alguns minutos e uma cópia é retornada a cada
+        chamada.
+        """
+        now = time.monotonic()
+        cached = self._categorias_programa_governo_cache.get(numero_programa_governo)
+
+        if cached is not None and now < cached[0]:
+            return cached[1].copy()
+
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["categorias_programa_governo"].format(
+                numero_programa_governo=numero_programa_governo,
+            ),
+            headers=headers,
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
-        return common._handle_results(
+        res = common._decode(res)
+        df = common._handle_results(
             res,
             main_list="categorias",
-            rename_dict={
-                "codigo": "Código Categoria",
-                "nome": "Nome Categoria",
-                "codigoCategoriaAgrupadora": "Código Categoria Agrupadora",
-                "indicadorDespesaAtiva": "Indicador Despesa Ativa",
-            },
+            rename_dict=_categorias_programa_governo_rename_dict,
         )
 
-    def get_saldo_aplicacoes_financeiras(
+        self._categorias_programa_governo_cache[numero_programa_governo] = (
+            now + common._categorias_programa_governo_cache_ttl.total_seconds(),
+            df,
+        )
+
+        return df.copy()
+
+    def get_saldo_aplicacoes_financeiras_raw(
         self,
         agencia: int,
         conta_corrente: int,
-    ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+    ) -> Dict[str, Any]:
+        """Retorna a resposta de ``get_saldo_aplicacoes_financeiras`` sem convertê-la em
+        ``pd.DataFrame``.
+        """
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["saldo_aplicacoes_financeiras"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+            ),
+            headers=headers,
+        )
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/saldos/{agencia}-{conta_corrente}/aplicacoes-financeiras",
-            headers=common._get_headers(access_token),
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        return common._decode(res)
+
+    def get_saldo_aplicacoes_financeiras(
+        self,
+        agencia: int,
+        conta_corrente: int,
+    ) -> pd.DataFrame:
+        res = self.get_saldo_aplicacoes_financeiras_raw(
+            agencia,
+            conta_corrente,
+        )
 
-        res = res.json()
         return common._handle_results(
             res,
             main_list="operacoes",
-            insertables=[
-                "dataSaldo",
-                "valorDisponibilidade",
-            ],
-            rename_dict={
-                "dataSaldo": "Data Saldo",
-                "valorDisponibilidade": "Valor Disponibilidade",
-                "codigo": "Código",
-                "valor": "Valor",
-                "indicadorSaldoNaoDisponivel": "Indicador Saldo Não Disponível",
-                "mensagemSaldoApurado": "Mensagem Saldo Apurado",
-            },
+            insertables=_saldo_aplicacoes_financeiras_insertables,
+            rename_dict=_saldo_aplicacoes_financeiras_rename_dict,
         )
 
-    def get_saldo_conta_corrente(
+    def get_saldo_conta_corrente_raw(
         self,
         agencia: str,
         conta_corrente: str,
-    ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+    ) -> Dict[str, Any]:
+        """Retorna a resposta de ``get_saldo_conta_corrente`` sem convertê-la em
+        ``pd.DataFrame``.
+        """
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["saldo_conta_corrente"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+            ),
+            headers=headers,
+        )
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/saldos/{agencia}-{conta_corrente}/conta-corrente",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        return common._decode(res)
+
+    def get_saldo_conta_corrente(
+        self,
+        agencia: str,
+        conta_corrente: str,
+    ) -> pd.DataFrame:
+        res = self.get_saldo_conta_corrente_raw(
+            agencia,
+            conta_corrente,
+        )
 
-        res = res.json()
         return common._handle_results(
             res,
-            rename_dict={
-                "dataSaldo": "Data Saldo",
-                "valorDisponibilidade": "Valor Disponibilidade",
-            },
+            rename_dict=_saldo_conta_corrente_rename_dict,
         )
 
     def post_categoria_despesa_lancamento_credito(
@@ -1036,19 +1417,15 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         codigo_categoria_despesa: int,
         codigo_listagem_cliente: str,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "POST",
-            f"{self._api_domain}/accountability/v3/orgaos-repasse/lancamentos-credito/{ordem_bancaria}-{item}/categorias-despesa",
-            headers={
-                "Content-Type": "application/json",
-                **common._get_headers(access_token),
-            },
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
-            data={
+        headers = self._get_headers()
+
+        res = self._session.post(
+            self._urls["post_categoria_despesa_lancamento_credito"].format(
+                ordem_bancaria=ordem_bancaria,
+                item=item,
+            ),
+            headers=headers,
+            json={
                 "agencia": agencia,
                 "contaCorrente": conta_corrente,
                 "codigoContrato": codigo_contrato,
@@ -1058,18 +1435,15 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
             },
         )
 
-        if res.status_code not in [200, 201]:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
-            rename_dict={
-                "timestampInclusaoCategoriaDespesa": "Momento Inclusão Categoria Despesa",
-            },
+            rename_dict=_post_categoria_despesa_lancamento_credito_rename_dict,
         )
 
     def post_identificacao_lancamento_credito(
@@ -1084,20 +1458,16 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         tipo_identificacao: int,
         codigo_identificacao: str,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         data_lancamento = common._handle_dates(data_lancamento)
 
-        res = requests.request(
-            "POST",
-            f"{self._api_domain}/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-credito",
-            headers={
-                "Content-Type": "application/json",
-                **common._get_headers(access_token),
-            },
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
-            data={
+        res = self._session.post(
+            self._urls["post_identificacao_lancamento_credito"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+            ),
+            headers=headers,
+            json={
                 "numeroBancario": numero_bancario,
                 "numeroSequencialOrdemBancaria": numero_sequencial_ordem_bancaria,
                 "dataLancamento": data_lancamento,
@@ -1108,20 +1478,15 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
             },
         )
 
-        if res.status_code not in [200, 201]:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
-            rename_dict={
-                "numeroSequencialLancamentoContaCorrente": "Número Sequencial Lançamento Conta Corrente",
-                "numeroSequencialIdentificacaoLancamento": "Número Sequencial Identificação Lançamento",
-                "timestampInclusaoIdentificacaoLancamento": "Momento Inclusão Identificação Lançamento",
-            },
+            rename_dict=_post_identificacao_lancamento_credito_rename_dict,
         )
 
     def delete_identificacao_lancamento_credito(
@@ -1131,29 +1496,27 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         sequencial_lancamento: str,
         sequencial_identificacao: str,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "DELETE",
-            f"{self._api_domain}/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-credito/{sequencial_lancamento}-{sequencial_identificacao}",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
+        headers = self._get_headers()
+
+        res = self._session.delete(
+            self._urls["delete_identificacao_lancamento_credito"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+                sequencial_lancamento=sequencial_lancamento,
+                sequencial_identificacao=sequencial_identificacao,
+            ),
+            headers=headers,
         )
 
-        if res.status_code not in [200, 201]:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
-            rename_dict={
-                "timestampExclusaoIdentificacaoLancamento": "Momento Exclusão Identificação Lançamento",
-            },
+            rename_dict=_delete_identificacao_lancamento_credito_rename_dict,
         )
 
     def get_identificacao_lancamento_debito(
@@ -1162,43 +1525,50 @@ class AccountabilityV3RepasseAPI(_AccountabilityV3BaseAPI):
         conta_corrente: str,
         numero_pagina: int = 1,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/orgaos-repasse/{agencia}-{conta_corrente}/lancamentos-debito",
-            headers=common._get_headers(access_token),
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["identificacao_lancamento_debito"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+            ),
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "numeroPagina": numero_pagina,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaLancamento",
-            insertables=[
-                "numeroPaginaTotal",
-                "quantidadeIdentificacaoLancamento",
-            ],
-            rename_dict={
-                "numeroPaginaTotal": "Número Página Total",
-                "quantidadeIdentificacaoLancamento": "Quantidade Identificação Lançamento",
-                "numeroSequencialLancamentoContaCorrente": "Número Sequencial Lançamento Conta Corrente",
-                "numeroSequencialIdentificacaoLancamento": "Número Sequencial Identificação Lançamento",
-                "tipoIdentificacao": "Tipo Identificação",
-                "tipoIdentificacaoTexto": "Tipo Identificação Texto",
-                "codigoIdentificacao": "Código Identificação",
-                "numeroCompanhia": "Número Companhia",
-                "valorFracionado": "Valor Fracionado",
-            },
+            insertables=_identificacao_lancamento_debito_insertables,
+            rename_dict=_identificacao_lancamento_debito_rename_dict,
+            categorical_cols=_identificacao_lancamento_debito_categorical_cols,
+        )
+
+    def get_identificacao_lancamento_debito_all(
+        self,
+        agencia: str,
+        conta_corrente: str,
+    ) -> pd.DataFrame:
+        """Busca todas as páginas de ``get_identificacao_lancamento_debito``.
+
+        A primeira página informa o total de páginas e as demais são buscadas
+        de forma concorrente, sendo concatenadas na ordem das páginas.
+        """
+        return self._get_all_pages(
+            lambda numero_pagina: self.get_identificacao_lancamento_debito(
+                agencia,
+                conta_corrente,
+                numero_pagina,
+            ),
+            "Número Página Total",
         )
 
 
@@ -1206,10 +1576,13 @@ class AccountabilityV3ControleAPI(_AccountabilityV3BaseAPI):
     """Representa um encapsulador da API Accountability V3 do Banco do Brasil
     para os órgaos de controle.
 
-    Esse encapsulador já reutiliza o token de acesso por 10 minutos e gera um
-    novo sempre que o atual estiver expirado.
+    Esse encapsulador já reutiliza o token de acesso durante o tempo de
+    expiração informado pelo Banco do Brasil e gera um novo sempre que o atual
+    estiver expirado.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         ambiente: common.Ambiente = common.Ambiente.HOMOLOGACAO,
@@ -1231,342 +1604,37 @@ class AccountabilityV3ControleAPI(_AccountabilityV3BaseAPI):
         start_date: common.DateLike,
         end_date: common.DateLike,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
         start_date = common._handle_dates(start_date)
         end_date = common._handle_dates(end_date)
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/statements/{branch_code}-{account_number}/control-agencies",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["extrato_programa_governo_controle"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+            ),
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "startDate": start_date,
                 "endDate": end_date,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível reaver o extrato do órgão repassador.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
 
         return common._handle_results(
             res,
             main_list="transactions",
-            insertables=[
-                "governmentProgramCode",
-                "governmentProgramName",
-                "governmentSubProgramCode",
-                "governmentSubProgramName",
-            ],
-            explodeables=[
-                "expensesDocuments",
-            ],
-            rename_dict={
-                "governmentProgramCode": "Código Programa Governo",
-                "governmentProgramName": "Nome Programa Governo",
-                "governmentSubProgramCode": "Código SubPrograma Governo",
-                "governmentSubProgramName": "Nome SubPrograma Governo",
-                "id": "ID Transação",
-                "bookingDate": "Data Agendamento",
-                "orderIndex": "Índice Ordem",
-                "valueDate": "Data Valor",
-                "referenceNumber": "Número Referência",
-                "value": "Valor",
-                "accountBalance": "Saldo Conta",
-                "descriptionCode": "Código Descrição",
-                "descriptionName": "Nome Descrição",
-                "descriptionBatchNumber": "Número Lote Descrição",
-                "creditDebitIndicator": "Indicador Crédito Débito",
-                "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
-                "beneficiaryBranchCode": "Código Agência Beneficiário",
-                "beneficiaryAccountNumber": "Número Conta Beneficiário",
-                "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
-                "beneficiaryDocumentId": "ID Documento Beneficiário",
-                "beneficiaryName": "Nome Beneficiário",
-                "pendingExpenseConciliation": "Conciliação Despesa Pendente",
-                "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
-                "expenseCategoryCode": "Código Categoria Despesa",
-                "expenseIdentificationStatus": "Status Identificação Despesa",
-                "subTransactionQuantity": "Quantidade Subtransações",
-                "bankOrderRuleCode": "Código Ordem Pagamento Banco",
-                "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
-                "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
-                "expenseSequentialNumber": "Número Sequencial Despesa",
-                "expensesCategory": "Categoria Despesa",
-                "expensesDocuments": "ID Documento Despesa",
-            },
-        )
-
-    def get_documento_despesas_programa_governo(
-        self,
-        branch_code: int,
-        account_number: int,
-        transaction_id: int,
-        document_id: int,
-        booking_date: common.DateLike,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        access_token = self._get_access_token()
-        booking_date = common._handle_dates(booking_date)
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/documents/{document_id}",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-                "bookingDate": booking_date,
-            },
-        )
-
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
-
-        res = res.json()
-
-        df_issuer = common._handle_results(
-            res["issuer"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-            },
-        )
-
-        df_recipient = common._handle_results(
-            res["recipient"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-                "presenceTypeCode": "Código Tipo Presença",
-                "typeConsumerCode": "Código Tipo Consumidor",
-            },
-        )
-
-        df_document = common._handle_results(
-            res["expenseDocument"],
-            main_list="items",
-            insertables=[
-                "accessKey",
-                "receiptTypeCode",
-                "typeCode",
-                "serialCode",
-                "number",
-                "issueDate",
-                "movementDate",
-                "itemDeliveryDate",
-                "value",
-                "operationTypeName",
-                "operation",
-                "paymentMethod",
-                "digitalSignatureCode",
-                "pronafAbilityRegistration",
-                "timestamp",
-                "userId",
-                "discountValue",
-                "totalDiscountValue",
-                "realeaseInstrumentCode",
-                "realeaseInstrumentName",
-                "realeaseInstrumentDate",
-                "additionalInformation",
-            ],
-            rename_dict={
-                "accessKey": "Chave Acesso",
-                "receiptTypeCode": "Código Tipo Recibo",
-                "typeCode": "Código Tipo",
-                "serialCode": "Código Série",
-                "number": "Número",
-                "issueDate": "Data Emissão",
-                "movementDate": "Data Movimentação",
-                "itemDeliveryDate": "Data Entrega",
-                "value": "Valor",
-                "operationTypeName": "Nome Tipo Operação",
-                "operation": "Operação",
-                "paymentMethod": "Método Pagamento",
-                "digitalSignatureCode": "Código Assinatura Digital",
-                "pronafAbilityRegistration": "Registro Habilidade Pronaf",
-                "timestamp": "Momento",
-                "userId": "ID Usuário",
-                "discountValue": "Valor Desconto",
-                "totalDiscountValue": "Valor Total Desconto",
-                "realeaseInstrumentCode": "Código Liberação de Instrumento",
-                "realeaseInstrumentName": "Nome Liberação Instrumento",
-                "realeaseInstrumentDate": "Data Liberação Instrumento",
-                "additionalInformation": "Informação Adicional",
-                "description": "Descrição Item",
-                "quantity": "Quantidade Item",
-                "metric": "Métrica Item",
-                "unitValue": "Valor Unitário Item",
-                "totalValue": "Valor Total Item",
-                "mercosurCommonNameId": "ID Nome Comum Mercosul",
-                "itemDiscountValue": "Valor Desconto Item",
-            },
-        )
-
-        return (
-            df_issuer,
-            df_recipient,
-            df_document,
-        )
-
-    def get_documento_despesas_prestacao_contas(
-        self,
-        branch_code: int,
-        account_number: int,
-        transaction_id: int,
-        subtransaction_id: int,
-        document_id: int,
-        booking_date: common.DateLike,
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        access_token = self._get_access_token()
-        booking_date = common._handle_dates(booking_date)
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/expenses/{branch_code}-{account_number}/transactions/{transaction_id}/subTransactions/{subtransaction_id}/documents/{document_id}",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-                "bookingDate": booking_date,
-            },
-        )
-
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível reaver o extrato do órgão repassador."
-            )
-
-        res = res.json()
-
-        df_issuer = common._handle_results(
-            res["issuer"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-            },
-        )
-
-        df_recipient = common._handle_results(
-            res["recipient"],
-            rename_dict={
-                "corporateTaxPayerRegistry": "CNPJ",
-                "individualTaxPayerRegistry": "CPF",
-                "stateRegistrationNumber": "RG",
-                "legalName": "Nome Legal",
-                "tradeName": "Nome Social",
-                "countryName": "Nacionalidade",
-                "stateAbbreviation": "UF",
-                "cityName": "Cidade",
-                "districtName": "Bairro",
-                "additionalAddressInformation": "Endereço",
-                "postalCode": "CEP",
-                "phoneNumber": "Telefone",
-                "presenceTypeCode": "Código Tipo Presença",
-                "typeConsumerCode": "Código Tipo Consumidor",
-            },
-        )
-
-        df_document = common._handle_results(
-            res["expenseDocument"],
-            main_list="items",
-            insertables=[
-                "accessKey",
-                "receiptTypeCode",
-                "typeCode",
-                "serialCode",
-                "number",
-                "issueDate",
-                "movementDate",
-                "itemDeliveryDate",
-                "value",
-                "operationTypeName",
-                "operation",
-                "paymentMethod",
-                "digitalSignatureCode",
-                "pronafAbilityRegistration",
-                "timestamp",
-                "userId",
-                "discountValue",
-                "totalDiscountValue",
-                "realeaseInstrumentCode",
-                "realeaseInstrumentName",
-                "realeaseInstrumentDate",
-                "additionalInformation",
-            ],
-            rename_dict={
-                "accessKey": "Chave Acesso",
-                "receiptTypeCode": "Código Tipo Recibo",
-                "typeCode": "Código Tipo",
-                "serialCode": "Código Série",
-                "number": "Número",
-                "issueDate": "Data Emissão",
-                "movementDate": "Data Movimentação",
-                "itemDeliveryDate": "Data Entrega",
-                "value": "Valor",
-                "operationTypeName": "Nome Tipo Operação",
-                "operation": "Operação",
-                "paymentMethod": "Método Pagamento",
-                "digitalSignatureCode": "Código Assinatura Digital",
-                "pronafAbilityRegistration": "Registro Habilidade Pronaf",
-                "timestamp": "Momento",
-                "userId": "ID Usuário",
-                "discountValue": "Valor Desconto",
-                "totalDiscountValue": "Valor Total Desconto",
-                "realeaseInstrumentCode": "Código Liberação de Instrumento",
-                "realeaseInstrumentName": "Nome Liberação Instrumento",
-                "realeaseInstrumentDate": "Data Liberação Instrumento",
-                "additionalInformation": "Informação Adicional",
-                "description": "Descrição Item",
-                "quantity": "Quantidade Item",
-                "metric": "Métrica Item",
-                "unitValue": "Valor Unitário Item",
-                "totalValue": "Valor Total Item",
-                "mercosurCommonNameId": "ID Nome Comum Mercosul",
-                "itemDiscountValue": "Valor Desconto Item",
-            },
-        )
-
-        return (
-            df_issuer,
-            df_recipient,
-            df_document,
+            insertables=_programa_governo_insertables,
+            explodeables=_extrato_programa_governo_explodeables,
+            rename_dict=_extrato_programa_governo_rename_dict,
+            categorical_cols=_extrato_programa_governo_categorical_cols,
+            date_cols=_extrato_programa_governo_date_cols,
         )
 
     def get_extrato_subtransacoes_programa_governo(
@@ -1575,66 +1643,31 @@ class AccountabilityV3ControleAPI(_AccountabilityV3BaseAPI):
         account_number: int,
         id: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/statements/{branch_code}-{account_number}/debits/{id}/control-agencies/subtransactions",
-            headers=common._get_headers(access_token),
-            params={
-                "gw-dev-app-key": self._app_key,
-            },
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["extrato_subtransacoes_programa_governo_controle"].format(
+                branch_code=branch_code,
+                account_number=account_number,
+                id=id,
+            ),
+            headers=headers,
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="subtransactions",
-            insertables=[
-                "governmentProgramCode",
-                "governmentProgramName",
-                "governmentSubProgramCode",
-                "governmentSubProgramName",
-            ],
-            explodeables=[
-                "expensesCategory",
-                "expensesDocuments",
-            ],
-            rename_dict={
-                "governmentProgramCode": "Código Programa Governo",
-                "governmentProgramName": "Nome Programa Governo",
-                "governmentSubProgramCode": "Código SubPrograma Governo",
-                "governmentSubProgramName": "Nome SubPrograma Governo",
-                "id": "ID",
-                "codeSubtransactionState": "Estado Código Subtransação",
-                "paymentState": "Estado Pagamento",
-                "paymentDate": "Data Pagamento",
-                "value": "Valor",
-                "beneficiaryBankIdentifierCode": "Código Identificador Banco Beneficiário",
-                "beneficiaryBranchCode": "Código Agência Beneficiário",
-                "beneficiaryAccountNumber": "Número Conta Beneficiário",
-                "beneficiaryPersonType": "Tipo Pessoa Beneficiário",
-                "beneficiaryDocumentId": "ID Documento Beneficiário",
-                "beneficiaryName": "Nome Beneficiário",
-                "attachedExpenseDocumentIndicator": "Indicador Anexo Documento Despesa",
-                "expenseCategoryCode": "Código Categoria Despesa",
-                "subtransactionAccountabilityIndicator": "Indicador Contabilidade Subtransação",
-                "subtransactionAccountabilityName": "Nome Contabilidade Subtransação",
-                "bankOrderPurposeCode": "Código Finalidade Ordem Banco",
-                "bankOrderRuleCode": "Código Ordem Pagamento Banco",
-                "bankOrderPurposeDescription": "Descrição Finalidade Ordem Banco",
-                "expenseSequentialNumber": "Número Sequencial Despesa",
-                "code": "Código Categoria Despesa",
-                "parentCode": "Código Pai Categoria Despesa",
-                "name": "Nome Categoria Despesa",
-                "expensesDocuments": "Documentos Despesa",
-            },
+            insertables=_programa_governo_insertables,
+            explodeables=_extrato_subtransacoes_programa_governo_explodeables,
+            rename_dict=_extrato_subtransacoes_programa_governo_rename_dict,
+            categorical_cols=_extrato_subtransacoes_programa_governo_categorical_cols,
+            date_cols=_extrato_subtransacoes_programa_governo_date_cols,
         )
 
     def get_extrato_fundos_investimento(
@@ -1645,144 +1678,39 @@ class AccountabilityV3ControleAPI(_AccountabilityV3BaseAPI):
         mes: int,
         ano: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/extratos/{agencia}-{conta_corrente}/fundos-investimentos/{fundo_investimento_id}/control-agencies",
-            headers=common._get_headers(access_token),
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["extrato_fundos_investimento_controle"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+                fundo_investimento_id=fundo_investimento_id,
+            ),
+            headers=headers,
             params={
                 "mes": mes,
                 "ano": ano,
-                "gw-dev-app-key": self._app_key,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
-        res["extrato"]["valorCotaExtrato"] = res["extrato"].pop("valorCota")
-        df = common._handle_results(
-            res["extrato"],
+        res = common._decode(res)
+        return common._handle_results(
+            ChainMap(
+                res["extrato"],
+                res,
+            ),
             main_list="listaLancamentosExtrato",
-            insertables=[
-                "numeroAgenciaRecebedora",
-                "digitoVerificadorContaRecebedora",
-                "numeroContaCorrenteRecebedora",
-                "numeroDigitoVerificadorContaCorrenteRecebedora",
-                "nomeClienteRecebedor",
-                "nomeFundoInvestimento",
-                "CNPJFundoInvestimento",
-                "valorCotaExtrato",
-                "dataAfericaoValorCota",
-                "ultimaCotacaoCota",
-                "dataUltimaCotacaoCota",
-                "sinalRentabilidadeMes",
-                "valorRentabilidadeMes",
-                "sinalRentabilidadeAno",
-                "valorRentabilidadeAno",
-                "sinalRentabilidadeResgateTotal",
-                "valorRentabilidadeResgateTotal",
-                "valorDisponivelResgate",
-                "valorCarenciaResgate",
-                "valorIRPrevisto",
-                "percentualIRPrevisto",
-                "valorIRComplementarPrevisto",
-                "valorIOFPrevisto",
-                "valorTaxaSaida",
-                "valorBonusDesempenho",
-                "valorBloqueado",
-                "valorAplicado",
-                "valorResgate",
-                "valorSaldoAnterior",
-                "quantidadeCotaAnterior",
-                "dataSaldoAnterior",
-                "valorTotalAplicadoPeriodo",
-                "valorTotalResgatadoPeriodo",
-                "sinalRendimentoBrutoPeriodo",
-                "valorRendimentoBrutoPeriodo",
-                "valorTotalIRPeriodo",
-                "valorTotalIOFPeriodo",
-                "valorTotalTaxaSaidaPeriodo",
-                "valorTotalBonusDesempenhoPeriodo",
-                "sinalRendimentoLiquido",
-                "valorRendimentoLiquido",
-                "valorSaldoMesAnterior",
-                "quantidadeCotaMesAnterior",
-                "dataSaldoMesAnterior",
-                "numeroLancamento",
-            ],
-            rename_dict={
-                "numeroAgenciaRecebedora": "Número Agência Recebedora",
-                "digitoVerificadorContaRecebedora": "Dígito Verificador Conta Recebedora",
-                "numeroContaCorrenteRecebedora": "Número Conta Corrente Recebedora",
-                "numeroDigitoVerificadorContaCorrenteRecebedora": "Número Dígito Verificador Conta Corrente Recebedora",
-                "nomeClienteRecebedor": "Nome Cliente Recebedor",
-                "nomeFundoInvestimento": "Nome Fundo Investimento",
-                "CNPJFundoInvestimento": " CNPJ Fundo Investimento",
-                "valorCotaExtrato": "Valor Cota Extrato",
-                "dataAfericaoValorCota": "Data Afericão Valor Cota",
-                "ultimaCotacaoCota": "Última Cotação Cota",
-                "dataUltimaCotacaoCota": "Data Última Cotação Cota",
-                "sinalRentabilidadeMes": "Sinal Rentabilidade Mês",
-                "valorRentabilidadeMes": "Valor Rentabilidade Mês",
-                "sinalRentabilidadeAno": "Sinal Rentabilidade Ano",
-                "valorRentabilidadeAno": "Valor Rentabilidade Ano",
-                "sinalRentabilidadeResgateTotal": "Sinal Rentabilidade Resgate Total",
-                "valorRentabilidadeResgateTotal": "Valor Rentabilidade Resgate Total",
-                "valorDisponivelResgate": "Valor Disponível Resgate",
-                "valorCarenciaResgate": "Valor Carência Resgate",
-                "valorIRPrevisto": "Valor IR Previsto",
-                "percentualIRPrevisto": "Percentual IR Previsto",
-                "valorIRComplementarPrevisto": "Valor IR Complementar Previsto",
-                "valorIOFPrevisto": "Valor IOF Previsto",
-                "valorTaxaSaida": "Valor Taxa Saída",
-                "valorBonusDesempenho": "Valor Bônus Desempenho",
-                "valorBloqueado": "Valor Bloqueado",
-                "valorAplicado": "Valor Aplicado",
-                "valorResgate": "Valor Resgate",
-                "valorSaldoAnterior": "Valor Saldo Anterior",
-                "quantidadeCotaAnterior": "Quantidade Cota Anterior",
-                "dataSaldoAnterior": "Data Saldo Anterior",
-                "valorTotalAplicadoPeriodo": "Valor Total Aplicado Período",
-                "valorTotalResgatadoPeriodo": "Valor Total Resgatado Período",
-                "sinalRendimentoBrutoPeriodo": "Sinal Rendimento Bruto Período",
-                "valorRendimentoBrutoPeriodo": "Valor Rendimento Bruto Período",
-                "valorTotalIRPeriodo": "Valor Total IR Período",
-                "valorTotalIOFPeriodo": "Valor Total IOF Período",
-                "valorTotalTaxaSaidaPeriodo": "Valor Total Taxa Saída Período",
-                "valorTotalBonusDesempenhoPeriodo": "Valor Total Bônus Desempenho Período",
-                "sinalRendimentoLiquido": "Sinal Rendimento Líquido",
-                "valorRendimentoLiquido": "Valor Rendimento Líquido",
-                "valorSaldoMesAnterior": "Valor Saldo Mês Anterior",
-                "quantidadeCotaMesAnterior": "Quantidade Cota Mês Anterior",
-                "dataSaldoMesAnterior": "Data Saldo Mês Anterior",
-                "numeroLancamento": "Número Lançamento",
-                "dataLancamento": "Data Lançamento",
-                "descricao": "Descrição",
-                "valorLancamento": "Valor Lançamento",
-                "valorIR": "Valor IR",
-                "valorPrejuizo": "Valor Prejuízo",
-                "valorIOF": "Valor IOF",
-                "quantidadeCota": "Quantidade Cota",
-                "valorCota": "Valor Cota Lançamento",
-                "saldoCotas": "Saldo Cotas",
-                "valorBaseCalculoIR": "Valor Base Cálculo IR",
-                "numeroDocumentoLancamento": "Número Documento Lançamento",
-            },
+            insertables=_extrato_fundos_investimento_insertables,
+            rename_dict=_extrato_fundos_investimento_rename_dict,
+            scalar_rename_dict=_extrato_fundos_investimento_scalar_rename_dict,
+            categorical_cols=_extrato_fundos_investimento_categorical_cols,
         )
 
-        df["Código Programa Governo"] = res["codigoProgramaGoverno"]
-        df["Nome Programa Governo"] = res["nomeProgramaGoverno"]
-        df["Código SubPrograma Governo"] = res["codigoSubProgramaGoverno"]
-        df["Nome SubPrograma Governo"] = res["nomeSubProgramaGoverno"]
-
-        return df
-
     def get_extrato_poupanca(
         self,
         agencia: str,
@@ -1790,101 +1718,72 @@ class AccountabilityV3ControleAPI(_AccountabilityV3BaseAPI):
         variacao_poupanca: str,
         codigo_variacao: int,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
-
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/extratos/{agencia}-{conta_corrente}/poupanca/{variacao_poupanca}/orgao-controle",
-            headers=common._get_headers(access_token),
+        headers = self._get_headers()
+
+        res = self._session.get(
+            self._urls["extrato_poupanca_controle"].format(
+                agencia=agencia,
+                conta_corrente=conta_corrente,
+                variacao_poupanca=variacao_poupanca,
+            ),
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "codigoVariacao": codigo_variacao,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaLancamentos",
-            insertables=[
-                "codigoProgramaGoverno",
-                "nomeProgramaGoverno",
-                "codigoSubProgramaGoverno",
-                "nomeSubProgramaGoverno",
-                "nomeCliente",
-                "identificadorCliente",
-                "saldoAnterior",
-                "saldoAtual",
-                "saldoBloqueado",
-                "saldoDisponivel",
-            ],
-            rename_dict={
-                "codigoProgramaGoverno": "Código Programa Governo",
-                "nomeProgramaGoverno": "Nome Programa Governo",
-                "codigoSubProgramaGoverno": "Código SubPrograma Governo",
-                "nomeSubProgramaGoverno": "Nome SubPrograma Governo",
-                "nomeCliente": "Nome Cliente",
-                "identificadorCliente": "Identificador Cliente",
-                "saldoAnterior": "Saldo Anterior",
-                "saldoAtual": "Saldo Atual",
-                "saldoBloqueado": "Saldo Bloqueado",
-                "saldoDisponivel": "Saldo Disponível",
-                "dataLancamento": "Data Lançamento",
-                "dataMovimento": "Data Movimento",
-                "diaLancamento": "Dia Lançamento",
-                "codigoHistorico": "Código Histórico",
-                "descricaoHistorico": "Descrição Histórico",
-                "indicadorDebitoCredito": "Indicador Débito Crédito",
-                "agenciaOrigem": "Agência Origem",
-                "numeroDocumento": "Número Documento",
-                "valorLancamento": "Valor Lançamento",
-            },
+            insertables=_extrato_poupanca_insertables,
+            rename_dict=_extrato_poupanca_rename_dict,
+            categorical_cols=_extrato_poupanca_categorical_cols,
         )
 
     def get_contas_correntes(
         self,
         numero_registro: str,
     ) -> pd.DataFrame:
-        access_token = self._get_access_token()
+        headers = self._get_headers()
 
-        res = requests.request(
-            "GET",
-            f"{self._api_domain}/accountability/v3/conta-corrente/orgaos-controle",
-            headers=common._get_headers(access_token),
+        res = self._session.get(
+            self._urls["contas_correntes"],
+            headers=headers,
             params={
-                "gw-dev-app-key": self._app_key,
                 "numeroRegistro": numero_registro,
             },
         )
 
-        if res.status_code != 200:
-            common._handle_error(res.json())
-            raise Exception(
-                "Não foi possível listar as categorias do programa de governo."
-            )
+        common._check_ok(
+            res,
+            "Não foi possível listar as categorias do programa de governo.",
+        )
 
-        res = res.json()
+        res = common._decode(res)
         return common._handle_results(
             res,
             main_list="listaContaCorrente",
-            insertables=[
-                "numeroRegistroConsultar",
-                "quantidadeContaCorrente",
-            ],
-            rename_dict={
-                "numeroRegistroConsultar": "Número Registro Consultar",
-                "quantidadeContaCorrente": "Quantidade Conta Corrente",
-                "codigoProgramaGoverno": "Código Programa Governo",
-                "nomeProgramaGoverno": "Nome Programa Governo",
-                "cnpj": "CNPJ",
-                "agencia": "Agência",
-                "nomeAgencia": "Nome Agência",
-                "contaCorrente": "Conta Corrente",
-            },
+            insertables=_contas_correntes_insertables,
+            rename_dict=_contas_correntes_rename_dict,
         )
+
+    def get_contas_correntes_many(
+        self,
+        numeros_registro: Sequence[str],
+    ) -> List[pd.DataFrame]:
+        """Busca as contas correntes de vários registros de forma concorrente.
+
+        Os resultados são retornados na ordem de ``numeros_registro``.
+        """
+        self._get_access_token()
+
+        with ThreadPoolExecutor(
+            max_workers=common._max_concurrent_requests
+        ) as executor:
+            return list(executor.map(self.get_contas_correntes, numeros_registro))
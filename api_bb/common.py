@@ -1,9 +1,16 @@
 import re
+import requests
 import pandas as pd
 from enum import Enum
-from sys import stderr
-from typing import Any, Dict, NewType, Sequence, Union
+from types import MappingProxyType
+from typing import Any, Mapping, NewType, Sequence, Tuple, Union
 from datetime import date, datetime, timedelta
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 _dese_oauth_domain = "https://oauth.desenv.bb.com.br"
 _homo_oauth_domain = "https://oauth.hm.bb.com.br"
@@ -15,12 +22,71 @@ _homo_api_domain = "https://api.hm.bb.com.br"
 _homo_alt_api_domain = "https://api.sandbox.bb.com.br"
 _prod_api_domain = "https://api.bb.com.br"
 
+_ascii_non_digits_table = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+_non_digits_regex = re.compile(r"\D")
+_iso_date_regex = re.compile(r"\d{4}-\d{2}-\d{2}\Z", re.ASCII)
+
 _time_between_access_token_requests = timedelta(minutes=10)
+_access_token_expiration_margin = timedelta(seconds=30)
+_categorias_programa_governo_cache_ttl = timedelta(minutes=10)
+
+_max_concurrent_requests = 8
+
+_http_pool_connections = 4
+_http_pool_maxsize = 20
+_http_max_retries = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
 
 
 DateLike = NewType("DateLike", Union[str | date | datetime])
 
 
+class BBAPIError(Exception):
+    """Erro retornado pela API do Banco do Brasil.
+
+    Guarda o código HTTP em ``status_code`` e o corpo da resposta em
+    ``data``.
+    """
+
+    def __init__(self, message: str, status_code: int = None, data: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.data = data
+
+    @classmethod
+    def from_response(cls, res: requests.Response, message: str) -> "BBAPIError":
+        if cls is BBAPIError:
+            if res.status_code in [401, 403]:
+                cls = BBAuthError
+            elif res.status_code == 429:
+                cls = BBRateLimitError
+
+        try:
+            data = _decode(res)
+        except ValueError:
+            data = res.text
+
+        return cls(
+            f"{message} Resposta obtida ({res.status_code}): {data}",
+            res.status_code,
+            data,
+        )
+
+
+class BBAuthError(BBAPIError):
+    """Erro de autenticação ou autorização na API do Banco do Brasil."""
+
+
+class BBRateLimitError(BBAPIError):
+    """Limite de requisições à API do Banco do Brasil excedido."""
+
+
 class Ambiente(Enum):
     DESENVOLVIMENTO = 0
     HOMOLOGACAO = 1
@@ -28,25 +94,46 @@ class Ambiente(Enum):
     PRODUCAO = 3
 
 
-def _get_headers(access_token: str) -> Dict:
-    return {
+_ambiente_domains = {
+    Ambiente.DESENVOLVIMENTO: (_dese_api_domain, _dese_oauth_domain),
+    Ambiente.HOMOLOGACAO: (_homo_api_domain, _homo_oauth_domain),
+    Ambiente.HOMOLOGACAO_ALTERNATIVO: (_homo_alt_api_domain, _homo_alt_oauth_domain),
+    Ambiente.PRODUCAO: (_prod_api_domain, _prod_oauth_domain),
+}
+
+
+def _get_headers(access_token: str) -> Mapping[str, str]:
+    return MappingProxyType({
         "Authorization": f"Bearer {access_token}",
-    }
+    })
+
+
+def _decode(res: requests.Response) -> Any:
+    return _loads(res.content)
+
+
+def _check_ok(res: requests.Response, message: str) -> None:
+    if not res.ok:
+        raise BBAPIError.from_response(res, message)
 
 
 def _handle_numeric_string_with_symbols(v: str) -> str:
-    return re.sub(r"\D", "", v)
+    v = v.translate(_ascii_non_digits_table)
+
+    if not v.isascii():
+        v = _non_digits_regex.sub("", v)
+
+    return v
 
 
 def _handle_dates(v: DateLike) -> str:
     if isinstance(v, str):
+        if _iso_date_regex.match(v):
+            return date.fromisoformat(v).isoformat()
+
         v = datetime.strptime(v, "%Y-%m-%d")
-    elif isinstance(v, date):
-        v = datetime.combine(v, datetime.min.time())
 
-    v = v.strftime("%Y-%m-%d")
-
-    return v
+    return v.strftime("%Y-%m-%d")
 
 
 def _handle_results(
@@ -54,26 +141,70 @@ def _handle_results(
     main_list: str = None,
     insertables: Sequence[str] = None,
     explodeables: Sequence[str] = None,
-    rename_dict: Dict[str, str] = None,
+    rename_dict: Mapping[str, str] = None,
+    scalar_rename_dict: Mapping[str, str] = None,
+    categorical_cols: Sequence[str] = None,
+    date_cols: Mapping[str, str] = None,
 ) -> pd.DataFrame:
     if main_list is not None:
         df = pd.DataFrame(data[main_list])
+    elif isinstance(data, Mapping):
+        df = pd.DataFrame({key: [value] for key, value in data.items()})
     else:
         df = pd.DataFrame(data)
 
     if insertables is not None:
+        if scalar_rename_dict is None:
+            scalar_rename_dict = {}
+
+        scalars = {}
+
         for insertable in insertables:
-            df[insertable] = data[insertable]
+            column = scalar_rename_dict.get(insertable, insertable)
+
+            if column in df.columns:
+                df[column] = data[insertable]
+            else:
+                scalars[column] = data[insertable]
+
+        if scalars:
+            df = pd.concat(
+                [
+                    df,
+                    pd.DataFrame(scalars, index=df.index),
+                ],
+                axis=1,
+            )
 
     if explodeables is not None:
         for explodeable in explodeables:
             df = df.explode(explodeable, ignore_index=True)
 
     if rename_dict is not None:
-        df = df.rename(rename_dict, axis=1)
+        df.columns = [rename_dict.get(column, column) for column in df.columns]
+
+    if categorical_cols is not None:
+        for column in categorical_cols:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+
+    if date_cols is not None:
+        for column, date_format in date_cols.items():
+            if column in df.columns:
+                df[column] = pd.to_datetime(
+                    df[column],
+                    format=date_format,
+                    errors="coerce",
+                )
 
     return df
 
 
-def _handle_error(data: Any):
-    print(f"Houve um erro. Resposta obtida: {data}", file=stderr)
+def _handle_results_many(
+    data: Mapping[str, Any],
+    specs: Sequence[Tuple[str, Mapping[str, Any]]],
+) -> Tuple[pd.DataFrame, ...]:
+    return tuple(
+        _handle_results(data[key], **kwargs)
+        for key, kwargs in specs
+    )